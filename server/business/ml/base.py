@@ -3,12 +3,45 @@
 Base utilities for ML model handling.
 """
 import importlib
-from typing import Type, TYPE_CHECKING
+import sys
+import threading
+from functools import lru_cache
+from typing import Optional, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from regression.base import RegressionModel
 
 
+# Modules imported by nearly every model module
+COMMON_MODEL_IMPORTS = (
+    'sklearn.metrics',
+    'sklearn.model_selection',
+    'sklearn.pipeline',
+    'sklearn.preprocessing',
+)
+
+
+def read_stdin_with_warm_imports() -> str:
+    """
+    Read all of stdin while importing the modules every model needs.
+    
+    The scripts are spawned per task, so import time is paid on every run.
+    Reading stdin on a background thread lets those imports overlap with the
+    parent process writing the task input.
+    
+    Returns:
+        The full stdin contents
+    """
+    chunks = []
+    reader = threading.Thread(target=lambda: chunks.append(sys.stdin.read()), daemon=True)
+    reader.start()
+    for module_name in COMMON_MODEL_IMPORTS:
+        importlib.import_module(module_name)
+    reader.join()
+    return chunks[0] if chunks else ''
+
+
+@lru_cache(maxsize=None)
 def import_regression_model(model_name: str) -> Type['RegressionModel']:
     """
     Dynamically import regression model module and return the Model class.
@@ -41,6 +74,7 @@ def import_regression_model(model_name: str) -> Type['RegressionModel']:
         raise ImportError(f"Model module '{model_name}' not found: {e}")
 
 
+@lru_cache(maxsize=None)
 def import_model(model_name: str) -> Type:
     """
     Dynamically import model module and return the Model class.
@@ -73,7 +107,33 @@ def import_model(model_name: str) -> Type:
         raise ValueError(f"Unknown model type for '{model_name}'. Model name should start with a recognized prefix (e.g., 'regression.', 'classification.')")
 
 
+@lru_cache(maxsize=None)
+def get_param_grid_class(model_class: Type) -> Optional[Type]:
+    """
+    Extract the ParamGrid class from a model class's type hints.
+    
+    Args:
+        model_class: The model class to inspect
+        
+    Returns:
+        The ParamGrid class if found, None otherwise
+    """
+    # Regression models record it when the class is created
+    param_grid_class = getattr(model_class, 'param_grid_class', None)
+    if param_grid_class is not None:
+        return param_grid_class
+    # Otherwise read the Generic parameters from __orig_bases__
+    if hasattr(model_class, '__orig_bases__'):
+        for base in model_class.__orig_bases__:
+            # Check if this is a Generic type with parameters
+            if hasattr(base, '__args__') and len(base.__args__) >= 2:
+                # Second type parameter is ParamGridType
+                return base.__args__[1]
+    return None
+
+
 # Keep the old function for backward compatibility during transition
+@lru_cache(maxsize=None)
 def import_model_module(model_name: str):
     """
     Dynamically import model module.
@@ -4,8 +4,8 @@ This file contains utility functions and constants.
 NO default feature columns - they must be provided via stdin for data-specific requirements.
 """
 
-# Constants for model identification
-AVAILABLE_MODELS = [
+# Constants for model identification, in display order
+AVAILABLE_MODELS_ORDERED = (
     "regression.Linear_Regression_Hyperparameter_Tuning",
     "regression.Ridge",
     "regression.Lasso",
@@ -18,4 +18,7 @@ AVAILABLE_MODELS = [
     "regression.XGBoost",
     "regression.LightGBM",
     "regression.Polynomial_Regression"
-]
+)
+
+# Set view for membership checks
+AVAILABLE_MODELS = frozenset(AVAILABLE_MODELS_ORDERED)
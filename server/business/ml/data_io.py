@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tabular data loading and saving for the ML scripts.
+
+The reader is chosen from the file suffix. Faster engines (python-calamine for
+Excel, pyarrow for CSV/Parquet) are used when installed; otherwise pandas'
+defaults are used so the scripts keep working on a minimal environment.
+
+With pyarrow installed, an Excel file is parsed once and cached as a sibling
+Parquet file, which later tune and predict runs on the same upload read instead.
+"""
+import importlib.util
+import os
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+
+def _has_module(name: str) -> bool:
+    """Check whether an optional dependency is importable."""
+    return importlib.util.find_spec(name) is not None
+
+
+def _excel_cache_path(path: str) -> Path:
+    """Path of the Parquet cache kept next to an Excel file."""
+    source = Path(path)
+    return source.with_name(f"{source.name}.parquet")
+
+
+def _write_excel_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """
+    Write the Parquet cache for an Excel file, skipping it when that fails.
+
+    The cache is written to a temporary name and renamed into place, so a
+    concurrent reader never sees a partial file.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError, NotImplementedError):
+        # Read-only upload directories and sheets Arrow cannot type (mixed
+        # object columns, non-string headers) are simply read from Excel
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_table(path: str, columns: Optional[list] = None) -> pd.DataFrame:
+    """
+    Load a table from an Excel, CSV or Parquet file.
+
+    Args:
+        path: Path to the data file
+        columns: Optional subset of columns to read; other columns are skipped
+            at parse time instead of being loaded and dropped
+
+    Returns:
+        Loaded DataFrame
+    """
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+    suffix = Path(path).suffix.lower()
+    if suffix == '.parquet':
+        return pd.read_parquet(path, columns=columns)
+    if suffix == '.csv':
+        engine = 'pyarrow' if _has_module('pyarrow') else None
+        return pd.read_csv(path, usecols=columns, engine=engine)
+    engine = 'calamine' if _has_module('python_calamine') else None
+    if not _has_module('pyarrow'):
+        return pd.read_excel(path, usecols=columns, engine=engine)
+    
+    # A cache at least as new as the workbook is read with column pushdown;
+    # otherwise the whole sheet is parsed so the cache serves any column subset
+    cache_path = _excel_cache_path(path)
+    if cache_path.exists() and cache_path.stat().st_mtime >= Path(path).stat().st_mtime:
+        return pd.read_parquet(cache_path, columns=columns)
+    df = pd.read_excel(path, engine=engine)
+    _write_excel_cache(df, cache_path)
+    return df[columns] if columns is not None else df
+
+
+def save_table(df: pd.DataFrame, path: str) -> None:
+    """
+    Save a table to an Excel, CSV or Parquet file based on its suffix.
+
+    Args:
+        df: DataFrame to save
+        path: Output file path
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == '.parquet':
+        df.to_parquet(path, index=False, compression='zstd')
+    elif suffix == '.csv':
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False)
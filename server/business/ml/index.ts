@@ -225,6 +225,8 @@ export interface TuneOptions {
   targetColumn: string;
   taskId: string;
   paramGrid?: Record<string, any>;
+  reportTrainMetrics?: boolean;
+  modelOutputPath?: string;
 }
 
 /**
@@ -239,6 +241,7 @@ export interface PredictOptions {
   featureColumns: string[];
   targetColumn: string;
   taskId: string;
+  fittedModelPath?: string;
 }
 
 /**
@@ -252,7 +255,16 @@ export async function tune(options: TuneOptions): Promise<void> {
   // Ensure environment is ready (with proper mutex to prevent race conditions)
   await getInitPromise();
 
-  const { inputFile, model, featureColumns, targetColumn, taskId, paramGrid } = options;
+  const {
+    inputFile,
+    model,
+    featureColumns,
+    targetColumn,
+    taskId,
+    paramGrid,
+    reportTrainMetrics,
+    modelOutputPath,
+  } = options;
 
   // Prepare stdin data for Python script
   const stdinData = {
@@ -261,6 +273,8 @@ export async function tune(options: TuneOptions): Promise<void> {
     featureColumns,
     targetColumn,
     ...(paramGrid && { paramGrid }), // Include paramGrid if provided
+    ...(reportTrainMetrics && { reportTrainMetrics }), // Train-set metrics are opt-in
+    ...(modelOutputPath && { modelOutputPath }), // Save the fitted best model
   };
 
   // Execute Python task
@@ -292,6 +306,7 @@ export async function predict(options: PredictOptions): Promise<void> {
     featureColumns,
     targetColumn,
     taskId,
+    fittedModelPath,
   } = options;
 
   // Prepare stdin data for Python script
@@ -303,6 +318,7 @@ export async function predict(options: PredictOptions): Promise<void> {
     params,
     featureColumns,
     targetColumn,
+    ...(fittedModelPath && { fittedModelPath }), // Reuse a model saved during tuning
   };
 
   // Execute Python task
@@ -6,8 +6,11 @@ Reads all configuration from stdin JSON (no database interactions).
 Outputs structured JSON to stdout.
 """
 import json
+import logging
 import sys
 import warnings
+import joblib
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -21,7 +24,13 @@ sys.path.append(str(Path(__file__).parent))
 from structured_output import get_logger, emit_log
 
 # Import base utilities
-from base import import_model
+from base import import_model, read_stdin_with_warm_imports
+
+# Import data loading utilities
+from data_io import load_table, save_table
+
+# Rows passed to Model.predict at a time, capping intermediate memory on large files
+PREDICT_BATCH_ROWS = 100_000
 
 
 def predict_regression_model(
@@ -32,7 +41,8 @@ def predict_regression_model(
     params: dict,
     feature_columns: list,
     target_column: str,
-    logger
+    logger,
+    fitted_model_path: str = None
 ):
     """
     Perform batch prediction using a trained regression model.
@@ -46,6 +56,8 @@ def predict_regression_model(
         feature_columns: List of feature column names
         target_column: Target column name
         logger: Logger instance for logging progress
+        fitted_model_path: Optional path to a model saved by tune_model.py; when
+            given, it is loaded instead of being refit on the training data
         
     Returns:
         Tuple of (output_path, num_predictions)
@@ -54,32 +66,44 @@ def predict_regression_model(
     logger.info(f"Importing regression model for {model_name}")
     Model = import_model(model_name)
     
-    # Load training data and train model with best parameters
-    logger.info(f"Loading training data from {training_data_path}")
-    training_df = pd.read_excel(training_data_path)
-    logger.info(f"Training data loaded: {len(training_df)} rows")
+    if fitted_model_path:
+        # Reuse the model fitted during tuning instead of training it again
+        logger.info(f"Loading fitted model from {fitted_model_path}")
+        model = joblib.load(fitted_model_path)
+    else:
+        # Load training data and train model with best parameters
+        logger.info(f"Loading training data from {training_data_path}")
+        training_df = load_table(training_data_path, columns=[*feature_columns, target_column])
+        logger.info(f"Training data loaded: {len(training_df)} rows")
     
-    X_train = training_df[feature_columns]
-    y_train = training_df[target_column]
+        # Convert once to ndarrays of the model's preferred dtype so sklearn does
+        # not re-validate and copy the DataFrame on every call
+        X_train = training_df[feature_columns].to_numpy(dtype=Model.dtype)
+        y_train = training_df[target_column].to_numpy(dtype=Model.dtype)
     
-    # Create model with tuned parameters using the Model class's create_model method
-    logger.info(f"Creating {model_name} with tuned parameters")
-    model = Model.create_model(params)
+        # Create model with tuned parameters using the Model class's create_model method
+        logger.info(f"Creating {model_name} with tuned parameters")
+        model = Model.create_model(params)
     
-    # Train the model on full training dataset
-    logger.info("Training model on full training dataset")
-    model.fit(X_train, y_train)
-    logger.info("Model training completed")
+        # Train the model on full training dataset
+        logger.info("Training model on full training dataset")
+        model.fit(X_train, y_train)
+        logger.info("Model training completed")
     
-    # Load prediction data
+    # Load prediction data (all columns are kept so they appear in the output)
     logger.info(f"Loading prediction data from {prediction_data_path}")
-    prediction_df = pd.read_excel(prediction_data_path)
+    prediction_df = load_table(prediction_data_path)
     logger.info(f"Prediction data loaded: {len(prediction_df)} rows")
     
     # Make predictions using the Model class's predict method
     logger.info("Generating predictions")
-    X_pred = prediction_df[feature_columns]
-    predictions = Model.predict(model, X_pred)
+    X_pred = np.ascontiguousarray(prediction_df[feature_columns].to_numpy(dtype=Model.dtype))
+    batches = [
+        Model.predict(model, X_pred[start:start + PREDICT_BATCH_ROWS])
+        for start in range(0, len(X_pred), PREDICT_BATCH_ROWS)
+    ]
+    # Estimators reject zero-row input, so an empty file gets an empty column
+    predictions = pd.concat(batches) if batches else pd.Series([], dtype=np.float64, name='predictions')
     
     # Add predictions to dataframe
     prediction_df['Predicted_Value'] = predictions.values
@@ -87,7 +111,7 @@ def predict_regression_model(
     
     # Save results
     logger.info(f"Saving predictions to {output_path}")
-    prediction_df.to_excel(output_path, index=False)
+    save_table(prediction_df, output_path)
     logger.info("Predictions saved successfully")
     
     return output_path, len(predictions)
@@ -104,15 +128,18 @@ def main():
         "model": "ridge",
         "params": {"model__alpha": 1.0},
         "featureColumns": ["col1", "col2", "col3"],
-        "targetColumn": "target"
+        "targetColumn": "target",
+        "fittedModelPath": "/path/to/model.joblib"
     }
+    "fittedModelPath" is optional; when set, the saved model is used as-is and
+    the training data is not reloaded.
     """
     logger = get_logger(__name__)
     
     try:
         # Read input from stdin
         logger.info("Reading input configuration from stdin")
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(read_stdin_with_warm_imports())
         
         # Extract parameters
         training_data_path = input_data.get('trainingDataPath')
@@ -122,6 +149,7 @@ def main():
         params = input_data.get('params', {})
         feature_columns = input_data.get('featureColumns')
         target_column = input_data.get('targetColumn')
+        fitted_model_path = input_data.get('fittedModelPath')
         
         # Validate required parameters
         if not training_data_path:
@@ -150,7 +178,8 @@ def main():
                 params,
                 feature_columns,
                 target_column,
-                logger
+                logger,
+                fitted_model_path
             )
         # Future: Add support for other model types
         # elif model_name.startswith('classification.'):
@@ -161,7 +190,7 @@ def main():
             raise ValueError(f"Unknown model type for '{model_name}'. Model name should start with 'regression.', 'classification.', etc.")
         
         # Emit success status
-        emit_log("info", f"Batch prediction completed successfully! Output saved to {output_path}")
+        emit_log(f"Batch prediction completed successfully! Output saved to {output_path}", logging.INFO)
         
         # Output result information
         result_info = {
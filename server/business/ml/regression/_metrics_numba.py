@@ -0,0 +1,78 @@
+"""
+Fused regression metrics for evaluate().
+
+MSE, MAE and R² are computed from the same residuals, so a single kernel
+accumulates all of them instead of three separate sklearn metric calls. The
+kernel is compiled with Numba when it is installed; otherwise an equivalent
+NumPy implementation is used. Models import mse_mae_r2 inside evaluate(), so
+loading a model module neither imports Numba nor compiles the kernel.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; the NumPy path below gives the same results
+    njit = None
+
+
+def _r2(sse: float, sst: float) -> float:
+    """R² from the residual and total sums of squares, following r2_score for constant targets."""
+    if sst > 0:
+        return 1.0 - sse / sst
+    return 1.0 if sse == 0 else 0.0
+
+
+def _sums_numpy(y: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float]:
+    """Return (sse, sae, sst) with vectorised NumPy operations."""
+    residual = y - y_pred
+    centered = y - y.mean()
+    return float(np.dot(residual, residual)), float(np.abs(residual).sum()), float(np.dot(centered, centered))
+
+
+if njit is not None:
+    @njit(fastmath=True, parallel=True, cache=True)
+    def _sums(y: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float]:
+        """Return (sse, sae, sst) from two parallel passes over y and y_pred."""
+        n = y.shape[0]
+        sse = 0.0
+        sae = 0.0
+        sy = 0.0
+        for i in prange(n):
+            r = y[i] - y_pred[i]
+            sse += r * r
+            sae += abs(r)
+            sy += y[i]
+        # Second pass around the mean; syy - n * mean² cancels badly for large targets
+        mean_y = sy / n
+        sst = 0.0
+        for i in prange(n):
+            d = y[i] - mean_y
+            sst += d * d
+        return sse, sae, sst
+
+    # Compile (or load from the on-disk cache) at import rather than on the first evaluate()
+    _sums(np.zeros(2), np.zeros(2))
+else:
+    _sums = _sums_numpy
+
+
+def mse_mae_r2(y: Union[pd.Series, np.ndarray], y_pred: Union[pd.Series, np.ndarray]) -> Tuple[float, float, float]:
+    """
+    Compute MSE, MAE and R² in one fused pass.
+
+    Args:
+        y: True target values
+        y_pred: Predicted values
+
+    Returns:
+        Tuple of (mse, mae, r2)
+    """
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    y_pred = np.ascontiguousarray(y_pred, dtype=np.float64)
+    sse, sae, sst = _sums(y, y_pred)
+    return float(sse) / y.size, float(sae) / y.size, _r2(float(sse), float(sst))
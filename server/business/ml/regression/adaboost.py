@@ -2,20 +2,45 @@
 AdaBoost Model Module
 """
 
+from math import prod
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import AdaBoostRegressor
 from sklearn.tree import DecisionTreeRegressor
-from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
-from typing import Dict, Any, Union, Optional, Callable
+from typing import Dict, Any, Union, Optional, Callable, Iterable, Sequence
 from pydantic import BaseModel
 from sklearn.base import BaseEstimator
 
 from .base import RegressionModel, ProgressInfo, TuneResult
+from .param_sweep import StagedSweep
 
 
 
+# Grids larger than this are randomly sampled instead of searched exhaustively
+MAX_GRID_CANDIDATES = 20
+
+
+def _staged_predict(model: AdaBoostRegressor, X: pd.DataFrame, n_estimators: Sequence[int]) -> Iterable[np.ndarray]:
+    """
+    Yield the weighted-median prediction of the first n estimators for each n.
+
+    AdaBoostRegressor.staged_predict re-predicts every earlier tree at each
+    stage; here each tree predicts once and only the weighted median is redone.
+    """
+    predictions = np.array([est.predict(np.asarray(X)) for est in model.estimators_]).T
+    rows = np.arange(predictions.shape[0])
+    for n in n_estimators:
+        # Boosting may stop early; larger sizes then match the last fitted stage
+        limit = min(n, predictions.shape[1])
+        stage = predictions[:, :limit]
+        sorted_idx = np.argsort(stage, axis=1)
+        weight_cdf = np.cumsum(model.estimator_weights_[:limit][sorted_idx], axis=1)
+        median_idx = (weight_cdf >= 0.5 * weight_cdf[:, -1:]).argmax(axis=1)
+        yield stage[rows, sorted_idx[rows, median_idx]]
+
+
 class AdaBoostParamGrid(BaseModel):
     """Parameter grid for AdaBoostRegressionModel."""
     n_estimators: list[int] = [50, 100, 150]
@@ -40,26 +65,38 @@ class AdaBoostRegressionModel(RegressionModel[AdaBoostRegressor, AdaBoostParamGr
             # Convert pydantic model to dict, excluding None values
             param_grid_dict = param_grid.model_dump(exclude_none=True)
     
-        grid_search = GridSearchCV(
+        # n_estimators is scored from staged predictions: each candidate is fit once
+        # per fold with the largest ensemble and smaller sizes reuse its first trees
+        n_estimators_grid = param_grid_dict.pop('n_estimators', [base_model.n_estimators])
+        # Large grids are searched over a random subset of candidates instead
+        n_iter = None
+        if prod(len(v) for v in param_grid_dict.values()) > MAX_GRID_CANDIDATES:
+            n_iter = MAX_GRID_CANDIDATES
+        
+        sweep = StagedSweep(
             estimator=base_model,
             param_grid=param_grid_dict,
+            n_estimators=n_estimators_grid,
+            predict_stages=_staged_predict,
             cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
+            n_jobs=-1,
+            n_iter=n_iter,
+            random_state=42,
+            progress_callback=progress_callback
         )
     
-        grid_search.fit(X_train, y_train)
+        sweep.fit(X_train, y_train)
     
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': sweep.best_params_,
+            'best_score': float(sweep.best_score_),
+            'model': sweep.best_estimator_
         }
 
 
     
     @staticmethod
-    def evaluate(model: AdaBoostRegressor, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: AdaBoostRegressor, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
         y_pred = model.predict(X)
         return {
             'mse': float(mean_squared_error(y, y_pred)),
@@ -70,25 +107,22 @@ class AdaBoostRegressionModel(RegressionModel[AdaBoostRegressor, AdaBoostParamGr
 
     
     @staticmethod
-    def predict(model: AdaBoostRegressor, X: pd.DataFrame) -> pd.Series:
+    def predict(model: AdaBoostRegressor, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions')
 
 
     
     @staticmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> AdaBoostRegressor:
-        estimator_depth = 3
-        if params and 'estimator__max_depth' in params:
-            estimator_depth = params.pop('estimator__max_depth')
-    
-        model = AdaBoostRegressor(
-            estimator=DecisionTreeRegressor(max_depth=estimator_depth),
-            random_state=42
-        )
-        if params:
-            model.set_params(**params)
-        return model
+        # Build the constructor kwargs once instead of constructing and then set_params
+        kwargs = dict(params or {})
+        estimator_depth = kwargs.pop('estimator__max_depth', 3)
+        return AdaBoostRegressor(**{
+            'estimator': DecisionTreeRegressor(max_depth=estimator_depth),
+            'random_state': 42,
+            **kwargs
+        })
 
 
 # Alias for the model class
@@ -1,11 +1,11 @@
 """
-Abstract base class for regression models.
+Interface for regression models.
 
 This module defines the common interface that all regression models must implement.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Union, Optional, Callable, TypeVar, Generic, TypedDict
+from typing import Dict, Any, Union, Optional, Callable, ClassVar, Type, TypeVar, Protocol, TypedDict
+import numpy as np
 import pandas as pd
 from sklearn.base import BaseEstimator
 from sklearn.pipeline import Pipeline
@@ -30,27 +30,66 @@ class TuneResult(TypedDict):
     model: Union[BaseEstimator, Pipeline]
 
 
+def as_contiguous_array(X: Union[pd.DataFrame, np.ndarray], dtype: type) -> np.ndarray:
+    """
+    Convert features to a C-contiguous array of the given dtype.
+
+    Returns X itself when it already is one, so callers can convert once up
+    front and pass the result on without further copies.
+
+    Args:
+        X: Features as DataFrame or ndarray
+        dtype: Target floating point dtype, usually the model's `dtype`
+
+    Returns:
+        C-contiguous ndarray of dtype
+    """
+    if isinstance(X, pd.DataFrame):
+        X = X.to_numpy(dtype=dtype)
+    return np.ascontiguousarray(X, dtype=dtype)
+
+
 # Type variable for model type
 ModelType = TypeVar("ModelType", bound=Union[BaseEstimator, Pipeline])
 
 # Type variable for parameter grid type
-ParamGridType = TypeVar("ParamGridType", bound=BaseModel)
+ParamGridType = TypeVar("ParamGridType", bound=BaseModel, contravariant=True)
 
 
-class RegressionModel(ABC, Generic[ModelType, ParamGridType]):
+class RegressionModel(Protocol[ModelType, ParamGridType]):
     """
-    Abstract base class for regression models.
+    Interface for regression models.
 
     All regression model modules should implement this interface to ensure
-    consistency across different model implementations.
+    consistency across different model implementations. It is a Protocol, so
+    conformance is structural; model classes still subclass it explicitly to
+    inherit the `dtype` default and to record their ParamGrid type in
+    `param_grid_class` for scan_models and tune_model.
 
     Type Parameters:
         ModelType: The specific sklearn model type (Pipeline or BaseEstimator subclass)
         ParamGridType: The parameter grid model type (pydantic BaseModel subclass)
+
+    Attributes:
+        dtype: Floating point dtype that features and training targets are cast
+            to before fitting. float32 halves memory traffic; models that are
+            numerically sensitive override it with float64.
+        param_grid_class: The ParamGridType argument of the subclass's
+            RegressionModel[...] base, set once when the class is created
     """
 
+    dtype: type = np.float32
+    param_grid_class: ClassVar[Optional[Type[BaseModel]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for base in getattr(cls, '__orig_bases__', ()):
+            args = getattr(base, '__args__', ())
+            # Generic intermediates pass a TypeVar through instead of a class
+            if len(args) >= 2 and isinstance(args[1], type):
+                cls.param_grid_class = args[1]
+
     @staticmethod
-    @abstractmethod
     def tune(
         X_train: pd.DataFrame,
         y_train: pd.Series,
@@ -78,17 +117,16 @@ class RegressionModel(ABC, Generic[ModelType, ParamGridType]):
                 - 'best_params': Best parameters found during tuning
                 - 'model': Trained model with best parameters
         """
-        pass
+        ...
 
     @staticmethod
-    @abstractmethod
-    def evaluate(model: ModelType, X: pd.DataFrame, y: pd.Series) -> Dict[str, Any]:
+    def evaluate(model: ModelType, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, Any]:
         """
         Evaluate model performance on given data.
 
         Args:
             model: Trained model (specific type based on ModelType)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             y: Target as Series
 
         Returns:
@@ -97,25 +135,25 @@ class RegressionModel(ABC, Generic[ModelType, ParamGridType]):
                 - 'mae': Mean Absolute Error
                 - 'r2': R-squared score
         """
-        pass
+        ...
 
     @staticmethod
-    @abstractmethod
-    def predict(model: ModelType, X: pd.DataFrame) -> pd.Series:
+    def predict(model: ModelType, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         """
         Make predictions using trained model.
 
         Args:
             model: Trained model (specific type based on ModelType)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
 
         Returns:
-            Predictions as Series with index matching X
+            Predictions as Series with index matching X when X is a DataFrame.
+            Estimators return a freshly allocated array from predict(), so it
+            can be wrapped with copy=False instead of pandas' defensive copy.
         """
-        pass
+        ...
 
     @staticmethod
-    @abstractmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> ModelType:
         """
         Create a model instance with given parameters.
@@ -126,4 +164,4 @@ class RegressionModel(ABC, Generic[ModelType, ParamGridType]):
         Returns:
             Sklearn Pipeline or estimator with specified parameters (ModelType)
         """
-        pass
+        ...
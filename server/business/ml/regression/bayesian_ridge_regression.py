@@ -2,19 +2,40 @@
 Bayesian Ridge Regression Model Module
 """
 
+from functools import lru_cache
+from math import prod
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import BayesianRidge
-from sklearn.model_selection import GridSearchCV
+from joblib import parallel_config
+from sklearn.model_selection import KFold
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
 
-from .base import RegressionModel, ProgressInfo, TuneResult
+from .base import RegressionModel, ProgressInfo, TuneResult, as_contiguous_array
+from .param_sweep import ParamSweep
 
+# The estimator, Optuna, SciPy and the metrics kernel are imported inside the
+# methods that use them, so scanning model schemas does not pay for them
+
+
+@lru_cache(maxsize=None)
+def _import_optuna() -> Optional[Any]:
+    """Import Optuna on first use, or return None when it is not installed."""
+    try:
+        import optuna
+    except ImportError:
+        # Large grids fall back to random sampling without Optuna
+        return None
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    return optuna
+
+
+
+# Grids larger than this are randomly sampled instead of searched exhaustively
+MAX_GRID_CANDIDATES = 20
 
 
 class BayesianRidgeParamGrid(BaseModel):
@@ -26,8 +47,14 @@ class BayesianRidgeParamGrid(BaseModel):
 class BayesianRidgeRegressionModel(RegressionModel[Pipeline, BayesianRidgeParamGrid]):
     """BayesianRidge Regression model implementation."""
     
+    # The evidence maximisation is unstable in float32 at extreme alpha/lambda priors
+    dtype = np.float64
+    
     @staticmethod
     def tune(X_train: pd.DataFrame, y_train: pd.Series, param_grid: Optional[BayesianRidgeParamGrid] = None, progress_callback: Optional[Callable[[ProgressInfo], None]] = None) -> TuneResult:
+        from sklearn.linear_model import BayesianRidge
+        from sklearn.preprocessing import StandardScaler
+
         base_model = Pipeline([
             ("scaler", StandardScaler()),
             ("model", BayesianRidge())
@@ -41,44 +68,139 @@ class BayesianRidgeRegressionModel(RegressionModel[Pipeline, BayesianRidgeParamG
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
     
-        grid_search = GridSearchCV(
+        # Large grids are searched with Optuna's TPE sampler over log-uniform
+        # ranges between each hyperparameter's smallest and largest value
+        is_large_grid = prod(len(v) for v in param_grid_dict.values()) > MAX_GRID_CANDIDATES
+        if is_large_grid and _import_optuna() is not None:
+            return BayesianRidgeRegressionModel._tpe_search(X_train, y_train, base_model, param_grid_dict, progress_callback)
+        
+        # Without Optuna, candidates are sampled log-uniformly instead
+        n_iter = None
+        if is_large_grid:
+            from scipy.stats import loguniform
+
+            n_iter = MAX_GRID_CANDIDATES
+            param_grid_dict = {
+                k: loguniform(min(v), max(v)) if 0 < min(v) < max(v) else v
+                for k, v in param_grid_dict.items()
+            }
+        
+        # Sweep the final step over per-fold preprocessed data (5-fold CV),
+        # fitting the scaler once per fold instead of once per candidate
+        sweep = ParamSweep(
             estimator=base_model,
             param_grid=param_grid_dict,
             cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
+            n_jobs=-1,
+            n_iter=n_iter,
+            random_state=42,
+            progress_callback=progress_callback
         )
+        
+        # One BLAS thread per worker so parallel folds don't oversubscribe the CPUs
+        with parallel_config(backend='loky', inner_max_num_threads=1):
+            sweep.fit(X_train, y_train)
+    
+        return {
+            'best_params': sweep.best_params_,
+            'best_score': float(sweep.best_score_),
+            'model': sweep.best_estimator_
+        }
+
+
+    
+    @staticmethod
+    def _tpe_search(X_train: pd.DataFrame, y_train: pd.Series, base_model: Pipeline, param_grid_dict: Dict[str, list], progress_callback: Optional[Callable[[ProgressInfo], None]] = None) -> TuneResult:
+        """Tune with an Optuna TPE study, spending MAX_GRID_CANDIDATES trials."""
+        optuna = _import_optuna()
+
+        # Scale each fold once up front; trials only refit the BayesianRidge step
+        folds = []
+        for train, test in KFold(n_splits=5).split(X_train):
+            head = clone(Pipeline(base_model.steps[:-1]))
+            folds.append((
+                head.fit_transform(X_train.iloc[train]),
+                head.transform(X_train.iloc[test]),
+                y_train.iloc[train].to_numpy(),
+                y_train.iloc[test].to_numpy()
+            ))
+        final_name, final_step = base_model.steps[-1]
+    
+        def objective(trial: 'optuna.Trial') -> float:
+            params = {
+                k: trial.suggest_float(k, min(v), max(v), log=True) if 0 < min(v) < max(v) else trial.suggest_categorical(k, v)
+                for k, v in param_grid_dict.items()
+            }
+            model = clone(final_step).set_params(**{k[len(final_name) + 2:]: v for k, v in params.items()})
+            fold_mse = []
+            for step, (X_fold, X_val, y_fold, y_val) in enumerate(folds):
+                model.fit(X_fold, y_fold)
+                residual = y_val - model.predict(X_val)
+                fold_mse.append(float(np.dot(residual, residual)) / residual.shape[0])
+                # Trials that trail the others after a few folds are stopped early
+                trial.report(float(np.mean(fold_mse)), step)
+                if trial.should_prune():
+                    raise optuna.TrialPruned()
+            return float(np.mean(fold_mse))
     
-        grid_search.fit(X_train, y_train)
+        def on_trial(study: 'optuna.Study', trial: 'optuna.trial.FrozenTrial') -> None:
+            round_num = trial.number + 1
+            mse = trial.value if trial.value is not None else trial.intermediate_values.get(trial.last_step)
+            progress_callback({
+                'percentage': 100.0 * round_num / MAX_GRID_CANDIDATES,
+                'round': round_num,
+                'total_rounds': MAX_GRID_CANDIDATES,
+                'metrics': {'mse': float(mse)} if mse is not None else {},
+                'params': trial.params
+            })
     
+        study = optuna.create_study(
+            direction='minimize',
+            sampler=optuna.samplers.TPESampler(seed=42),
+            pruner=optuna.pruners.SuccessiveHalvingPruner()
+        )
+        study.optimize(
+            objective,
+            n_trials=MAX_GRID_CANDIDATES,
+            callbacks=[on_trial] if progress_callback is not None else None
+        )
+    
+        best_params = dict(sorted(study.best_params.items()))
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': best_params,
+            'best_score': -float(study.best_value),
+            'model': clone(base_model).set_params(**best_params).fit(X_train, y_train)
         }
 
 
     
     @staticmethod
-    def evaluate(model: Pipeline, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: Pipeline, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
+        from ._metrics_numba import mse_mae_r2
+
         y_pred = model.predict(X)
+        mse, mae, r2 = mse_mae_r2(y, y_pred)
         return {
-            'mse': float(mean_squared_error(y, y_pred)),
-            'mae': float(mean_absolute_error(y, y_pred)),
-            'r2': float(r2_score(y, y_pred))
+            'mse': mse,
+            'mae': mae,
+            'r2': r2
         }
 
 
     
     @staticmethod
-    def predict(model: Pipeline, X: pd.DataFrame) -> pd.Series:
-        predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+    def predict(model: Pipeline, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
+        # One contiguous buffer in the model's dtype instead of sklearn's per-call conversion
+        predictions = model.predict(as_contiguous_array(X, BayesianRidgeRegressionModel.dtype))
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions', copy=False)
 
 
     
     @staticmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> Pipeline:
+        from sklearn.linear_model import BayesianRidge
+        from sklearn.preprocessing import StandardScaler
+
         model = Pipeline([
             ("scaler", StandardScaler()),
             ("model", BayesianRidge())
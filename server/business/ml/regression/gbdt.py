@@ -1,33 +1,82 @@
 """
 GBDT (Gradient Boosting Decision Tree) Model Module
+
+Uses LightGBM's multithreaded histogram booster when it is installed and
+falls back to sklearn's HistGradientBoostingRegressor otherwise. The parameter
+grid keeps the HistGradientBoostingRegressor names for both backends.
 """
 
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor
-from sklearn.model_selection import GridSearchCV
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from joblib import parallel_config
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
+
+from .base import RegressionModel, ProgressInfo, TuneResult, as_contiguous_array
+
+# The boosting backends, the halving search and the metrics kernel are imported
+# inside the functions that use them, so scanning model schemas does not pay for them
+
 
-from .base import RegressionModel, ProgressInfo, TuneResult
+@lru_cache(maxsize=None)
+def _import_lgbm_regressor() -> Optional[type]:
+    """Import LGBMRegressor on first use, or return None when LightGBM is not installed."""
+    try:
+        from lightgbm import LGBMRegressor
+    except ImportError:
+        # LightGBM is optional; sklearn's histogram booster is used without it
+        return None
+    return LGBMRegressor
+
+
+# HistGradientBoostingRegressor parameter names mapped to LightGBM's
+LGBM_PARAM_NAMES = {'max_iter': 'n_estimators', 'max_leaf_nodes': 'num_leaves'}
+
+
+def _make_estimator(params: Optional[Dict[str, Any]] = None) -> BaseEstimator:
+    """Build the boosting estimator for the available backend from grid-named params."""
+    params = params or {}
+    LGBMRegressor = _import_lgbm_regressor()
+    if LGBMRegressor is not None:
+        return LGBMRegressor(
+            random_state=42,
+            n_jobs=-1,
+            verbose=-1,
+            **{LGBM_PARAM_NAMES.get(k, k): v for k, v in params.items()}
+        )
+    from sklearn.ensemble import HistGradientBoostingRegressor
+
+    return HistGradientBoostingRegressor(random_state=42, **params)
+
+
+def _to_grid_names(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate estimator params back to GBDTParamGrid names."""
+    grid_names = {v: k for k, v in LGBM_PARAM_NAMES.items()}
+    return {grid_names.get(k, k): v for k, v in params.items()}
 
 
 
 class GBDTParamGrid(BaseModel):
     """Parameter grid for GBDTRegressionModel."""
-    n_estimators: list[int] = [50, 100, 150]
+    max_iter: list[int] = [50, 100, 150]
     learning_rate: list[float] = [0.01, 0.1, 0.2]
-    max_depth: list[int] = [3, 5, 7]
+    max_leaf_nodes: list[int] = [15, 31, 63]
 
 
-class GBDTRegressionModel(RegressionModel[GradientBoostingRegressor, GBDTParamGrid]):
+class GBDTRegressionModel(RegressionModel[BaseEstimator, GBDTParamGrid]):
     """GBDT Regression model implementation."""
     
     @staticmethod
     def tune(X_train: pd.DataFrame, y_train: pd.Series, param_grid: Optional[GBDTParamGrid] = None, progress_callback: Optional[Callable[[ProgressInfo], None]] = None) -> TuneResult:
-        base_model = GradientBoostingRegressor(random_state=42)
+        from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+        from sklearn.model_selection import HalvingGridSearchCV
+
+        use_lgbm = _import_lgbm_regressor() is not None
+        base_model = _make_estimator()
+        size_param = 'n_estimators' if use_lgbm else 'max_iter'
     
         # Use provided param_grid or default
         if param_grid is None:
@@ -37,48 +86,87 @@ class GBDTRegressionModel(RegressionModel[GradientBoostingRegressor, GBDTParamGr
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
     
-        grid_search = GridSearchCV(
+        # Successive halving: every candidate starts with a few boosting iterations
+        # and only the best third is grown further. 'exhaust' picks the largest
+        # start whose last rung still fits under the largest max_iter; rungs are
+        # powers of the factor, so that rung can fall short of it (144 for 150)
+        # and the winner is refit at the grid's largest max_iter instead
+        max_iter_grid = param_grid_dict.pop('max_iter', [base_model.get_params()[size_param]])
+        if use_lgbm:
+            param_grid_dict = {LGBM_PARAM_NAMES.get(k, k): v for k, v in param_grid_dict.items()}
+        grid_search = HalvingGridSearchCV(
             estimator=base_model,
             param_grid=param_grid_dict,
             cv=5,
+            factor=3,
+            resource=size_param,
+            min_resources='exhaust',
+            max_resources=max(max_iter_grid),
             scoring='neg_mean_squared_error',
-            n_jobs=-1
+            n_jobs=-1,
+            random_state=42,
+            refit=False
         )
     
-        grid_search.fit(X_train, y_train)
+        # One OpenMP thread per worker so parallel fits don't oversubscribe the CPUs;
+        # the final refit in this process still uses every core
+        with parallel_config(backend='loky', inner_max_num_threads=1):
+            grid_search.fit(X_train, y_train)
+    
+        # Progress is reported per halving round once the parallel search is done,
+        # so the callback never forces the search onto a single worker
+        if progress_callback is not None:
+            results = grid_search.cv_results_
+            total_rounds = grid_search.n_iterations_
+            for round_idx in range(total_rounds):
+                in_round = [i for i, it in enumerate(results['iter']) if it == round_idx]
+                best = max(in_round, key=lambda i: results['mean_test_score'][i])
+                progress_callback({
+                    'percentage': 100.0 * (round_idx + 1) / total_rounds,
+                    'round': round_idx + 1,
+                    'total_rounds': total_rounds,
+                    'metrics': {'mse': float(-results['mean_test_score'][best])},
+                    'params': _to_grid_names(results['params'][best])
+                })
     
+        best_params = {**grid_search.best_params_, size_param: max(max_iter_grid)}
         return {
-            'best_params': grid_search.best_params_,
+            'best_params': _to_grid_names(best_params),
             'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'model': clone(base_model).set_params(**best_params).fit(X_train, y_train)
         }
 
 
     
     @staticmethod
-    def evaluate(model: GradientBoostingRegressor, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: BaseEstimator, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
+        from ._metrics_numba import mse_mae_r2
+
         y_pred = model.predict(X)
+        mse, mae, r2 = mse_mae_r2(y, y_pred)
         return {
-            'mse': float(mean_squared_error(y, y_pred)),
-            'mae': float(mean_absolute_error(y, y_pred)),
-            'r2': float(r2_score(y, y_pred))
+            'mse': mse,
+            'mae': mae,
+            'r2': r2
         }
 
 
     
     @staticmethod
-    def predict(model: GradientBoostingRegressor, X: pd.DataFrame) -> pd.Series:
-        predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+    def predict(model: BaseEstimator, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
+        # One contiguous buffer in the model's dtype instead of sklearn's per-call conversion
+        predictions = model.predict(as_contiguous_array(X, GBDTRegressionModel.dtype))
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions', copy=False)
 
 
     
     @staticmethod
-    def create_model(params: Optional[Dict[str, Any]] = None) -> GradientBoostingRegressor:
-        model = GradientBoostingRegressor(random_state=42)
-        if params:
-            model.set_params(**params)
-        return model
+    def create_model(params: Optional[Dict[str, Any]] = None) -> BaseEstimator:
+        params = dict(params or {})
+        # Params tuned before the switch to histogram boosting used n_estimators
+        if 'n_estimators' in params:
+            params['max_iter'] = params.pop('n_estimators')
+        return _make_estimator(params)
 
 
 # Alias for the model class
@@ -2,19 +2,38 @@
 K-Nearest Neighbors Model Module
 """
 
+import numpy as np
 import pandas as pd
-from sklearn.neighbors import KNeighborsRegressor
-from sklearn.model_selection import GridSearchCV
+from sklearn.model_selection import KFold, ParameterGrid
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
 
 from .base import RegressionModel, ProgressInfo, TuneResult
 
+# The estimator, scaler and metrics are imported inside the methods that use
+# them, so scanning model schemas does not pay for them
+
+# KD-trees stop pruning well above this many features; ball trees degrade more gracefully
+KD_TREE_MAX_FEATURES = 20
+
+
+def _neighbor_average(distances: np.ndarray, targets: np.ndarray, weights: str) -> np.ndarray:
+    """Average neighbor targets the same way KNeighborsRegressor.predict does."""
+    if weights == 'uniform':
+        return targets.mean(axis=1)
+    if weights != 'distance':
+        raise ValueError(f"Unsupported weights '{weights}'. Expected 'uniform' or 'distance'.")
+    
+    with np.errstate(divide='ignore'):
+        inverse = 1.0 / distances
+    # Exact matches take all the weight, as in sklearn.neighbors._base._get_weights
+    inf_mask = np.isinf(inverse)
+    inf_rows = inf_mask.any(axis=1)
+    inverse[inf_rows] = inf_mask[inf_rows]
+    return (targets * inverse).sum(axis=1) / inverse.sum(axis=1)
 
 
 class KNNParamGrid(BaseModel):
@@ -28,9 +47,16 @@ class KNNRegressionModel(RegressionModel[Pipeline, KNNParamGrid]):
     
     @staticmethod
     def tune(X_train: pd.DataFrame, y_train: pd.Series, param_grid: Optional[KNNParamGrid] = None, progress_callback: Optional[Callable[[ProgressInfo], None]] = None) -> TuneResult:
+        # Neighbor queries dominate CV cost, so run them on all cores with a tree
+        # index suited to the feature count
+        from sklearn.metrics import mean_squared_error
+        from sklearn.neighbors import KNeighborsRegressor
+        from sklearn.preprocessing import StandardScaler
+
+        algorithm = 'kd_tree' if X_train.shape[1] <= KD_TREE_MAX_FEATURES else 'ball_tree'
         base_model = Pipeline([
             ("scaler", StandardScaler()),
-            ("model", KNeighborsRegressor())
+            ("model", KNeighborsRegressor(algorithm=algorithm, n_jobs=-1))
         ])
     
         # Use provided param_grid or default
@@ -41,26 +67,60 @@ class KNNRegressionModel(RegressionModel[Pipeline, KNNParamGrid]):
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
     
-        grid_search = GridSearchCV(
-            estimator=base_model,
-            param_grid=param_grid_dict,
-            cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
-        )
+        # The fitted neighbor index only depends on the fold, not on n_neighbors or
+        # weights. Query the largest k once per fold and score every smaller k and
+        # weighting scheme from prefixes of that neighbor list.
+        n_neighbors_grid = sorted(param_grid_dict.pop('model__n_neighbors', [5]))
+        weights_grid = param_grid_dict.pop('model__weights', ['uniform'])
+        max_neighbors = n_neighbors_grid[-1]
+        candidates = list(ParameterGrid(param_grid_dict))
+        splits = list(KFold(n_splits=5).split(X_train))
     
-        grid_search.fit(X_train, y_train)
+        # Mean fold score for each (candidate, n_neighbors, weights) triple
+        scores = np.zeros((len(candidates), len(n_neighbors_grid), len(weights_grid)))
+        for i, params in enumerate(candidates):
+            for train, test in splits:
+                # A fold can hold fewer training rows than the largest k; those
+                # k cannot be fit and score -inf, as GridSearchCV scores them NaN
+                n_query = min(max_neighbors, len(train))
+                pipeline = clone(base_model).set_params(**params, model__n_neighbors=n_query)
+                pipeline.fit(X_train.iloc[train], y_train.iloc[train])
+    
+                distances, indices = pipeline[-1].kneighbors(pipeline[:-1].transform(X_train.iloc[test]))
+                neighbor_targets = y_train.iloc[train].to_numpy()[indices]
+                y_val = y_train.iloc[test].to_numpy()
+                for j, n_neighbors in enumerate(n_neighbors_grid):
+                    if n_neighbors > n_query:
+                        scores[i, j, :] = -np.inf
+                        continue
+                    for w, weights in enumerate(weights_grid):
+                        y_pred = _neighbor_average(distances[:, :n_neighbors], neighbor_targets[:, :n_neighbors], weights)
+                        scores[i, j, w] -= mean_squared_error(y_val, y_pred) / len(splits)
+    
+        if np.all(np.isneginf(scores)):
+            raise ValueError(
+                f"Every n_neighbors in {n_neighbors_grid} exceeds the training rows of a CV fold"
+            )
+        best_i, best_j, best_w = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        best_params = dict(sorted({
+            **candidates[best_i],
+            'model__n_neighbors': n_neighbors_grid[best_j],
+            'model__weights': weights_grid[best_w]
+        }.items()))
+        best_model = clone(base_model).set_params(**best_params).fit(X_train, y_train)
     
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': best_params,
+            'best_score': float(scores[best_i, best_j, best_w]),
+            'model': best_model
         }
 
 
     
     @staticmethod
-    def evaluate(model: Pipeline, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: Pipeline, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
+        from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+
         y_pred = model.predict(X)
         return {
             'mse': float(mean_squared_error(y, y_pred)),
@@ -71,17 +131,20 @@ class KNNRegressionModel(RegressionModel[Pipeline, KNNParamGrid]):
 
     
     @staticmethod
-    def predict(model: Pipeline, X: pd.DataFrame) -> pd.Series:
+    def predict(model: Pipeline, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions')
 
 
     
     @staticmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> Pipeline:
+        from sklearn.neighbors import KNeighborsRegressor
+        from sklearn.preprocessing import StandardScaler
+
         model = Pipeline([
             ("scaler", StandardScaler()),
-            ("model", KNeighborsRegressor())
+            ("model", KNeighborsRegressor(n_jobs=-1))
         ])
         if params:
             model.set_params(**params)
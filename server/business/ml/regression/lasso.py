@@ -7,15 +7,16 @@ All functions accept pandas DataFrames instead of file paths.
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import Lasso
-from sklearn.model_selection import GridSearchCV
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
 
-from .base import RegressionModel, ProgressInfo, TuneResult
+from .base import RegressionModel, ProgressInfo, TuneResult, as_contiguous_array
+from .param_sweep import neg_mse
+
+# Estimators, preprocessing and CV splitters are imported inside the methods
+# that use them, so loading the module only pays for the sklearn core
 
 
 
@@ -24,6 +25,10 @@ class LassoParamGrid(BaseModel):
     model__alpha: list[float] = [0.0001, 0.001, 0.01, 0.1, 1.0, 10.0]
 
 
+# Built once at import; tune() works on a copy so the default is never mutated
+_DEFAULT_GRID = LassoParamGrid().model_dump()
+
+
 class LassoRegression(RegressionModel[Pipeline, LassoParamGrid]):
     """Lasso Regression model implementation."""
     
@@ -39,6 +44,10 @@ class LassoRegression(RegressionModel[Pipeline, LassoParamGrid]):
         Returns:
             Dictionary with 'best_params', 'best_score', and 'model'
         """
+        from sklearn.linear_model import Lasso, lasso_path
+        from sklearn.model_selection import KFold
+        from sklearn.preprocessing import StandardScaler
+
         base_model = Pipeline([
             ("scaler", StandardScaler()),
             ("model", Lasso(random_state=42))
@@ -46,63 +55,78 @@ class LassoRegression(RegressionModel[Pipeline, LassoParamGrid]):
         
         # Use provided param_grid or default
         if param_grid is None:
-            param_grid_dict = LassoParamGrid().model_dump()
+            param_grid_dict = dict(_DEFAULT_GRID)
         else:
             # Convert pydantic model to dict, excluding None values
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
         
-        grid_search = GridSearchCV(
-            estimator=base_model,
-            param_grid=param_grid_dict,
-            cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
-        )
+        # Solve each fold's whole alpha grid as one regularization path (5-fold CV):
+        # coordinate descent for each alpha starts from the previous, larger
+        # alpha's coefficients instead of from zero
+        alphas = np.array(sorted(param_grid_dict.get('model__alpha', [1.0]), reverse=True))
+        # Folds are sliced from contiguous arrays converted once up front
+        X_values = as_contiguous_array(X_train, LassoRegression.dtype)
+        y_values = y_train.to_numpy()
+        scores = np.zeros(len(alphas))
+        for train, test in KFold(n_splits=5).split(X_values):
+            scaler = StandardScaler()
+            X_fold = scaler.fit_transform(X_values[train])
+            X_val = scaler.transform(X_values[test])
+            y_fold = y_values[train]
+            y_val = y_values[test]
+            # Scaled features are centred, so centring y gives Lasso's intercept
+            y_mean = y_fold.mean()
+            _, coefs, _ = lasso_path(X_fold, y_fold - y_mean, alphas=alphas)
+            for j in range(len(alphas)):
+                scores[j] += neg_mse(y_val, X_val @ coefs[:, j] + y_mean) / 5
         
-        grid_search.fit(X_train, y_train)
+        best = int(np.argmax(scores))
+        best_params = {'model__alpha': float(alphas[best])}
         
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': best_params,
+            'best_score': float(scores[best]),
+            'model': clone(base_model).set_params(**best_params).fit(X_train, y_train)
         }
     
     @staticmethod
-    def evaluate(model: Pipeline, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: Pipeline, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
         """
         Evaluate model performance on given data.
         
         Args:
             model: Trained model (sklearn Pipeline or estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             y: Target as Series
             
         Returns:
             Dictionary with MSE, MAE, and R2 scores
         """
+        from ._metrics_numba import mse_mae_r2
+
         y_pred = model.predict(X)
-        
+        mse, mae, r2 = mse_mae_r2(y, y_pred)
         return {
-            'mse': float(mean_squared_error(y, y_pred)),
-            'mae': float(mean_absolute_error(y, y_pred)),
-            'r2': float(r2_score(y, y_pred))
+            'mse': mse,
+            'mae': mae,
+            'r2': r2
         }
     
     @staticmethod
-    def predict(model: Pipeline, X: pd.DataFrame) -> pd.Series:
+    def predict(model: Pipeline, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         """
         Make predictions using trained model.
         
         Args:
             model: Trained model (sklearn Pipeline or estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             
         Returns:
             Predictions as Series
         """
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions')
     
     @staticmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> Pipeline:
@@ -115,6 +139,9 @@ class LassoRegression(RegressionModel[Pipeline, LassoParamGrid]):
         Returns:
             Sklearn Pipeline with StandardScaler and Lasso model
         """
+        from sklearn.linear_model import Lasso
+        from sklearn.preprocessing import StandardScaler
+
         model = Pipeline([
             ("scaler", StandardScaler()),
             ("model", Lasso(random_state=42))
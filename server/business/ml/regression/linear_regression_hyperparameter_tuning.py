@@ -7,22 +7,59 @@ All functions accept pandas DataFrames instead of file paths.
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import GridSearchCV
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from sklearn.base import BaseEstimator
 
-from .base import RegressionModel, ProgressInfo, TuneResult
+from .base import RegressionModel, ProgressInfo, TuneResult, as_contiguous_array
 
+# Estimators, preprocessing and grids are imported inside the functions that
+# use them, so loading the module only pays for the sklearn core
+
+
+def _make_pipeline(fit_intercept: bool = True) -> Pipeline:
+    """
+    Build the scaler + LinearRegression pipeline.
+
+    With an intercept, OLS predictions do not change under feature scaling, so
+    the scaler step is left as a passthrough instead of spending two passes
+    over X; without one, centring changes the model and the scaler is kept.
+    """
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import StandardScaler
+
+    return Pipeline([
+        ("scaler", 'passthrough' if fit_intercept else StandardScaler()),
+        ("model", LinearRegression(fit_intercept=fit_intercept))
+    ])
+
+
+def _loo_mse(X: np.ndarray, y: np.ndarray) -> float:
+    """
+    Exact leave-one-out MSE of an ordinary least squares fit.
+
+    Each held-out residual equals the full-fit residual divided by 1 - h_i,
+    where h_i is the sample's leverage, so no model is refit per sample. The
+    thin SVD also handles rank-deficient designs like lstsq does.
+    """
+    U, s, _ = np.linalg.svd(X, full_matrices=False)
+    U = U[:, s > s[0] * max(X.shape) * np.finfo(X.dtype).eps]
+    leverage = np.einsum('ij,ij->i', U, U)
+    residual = y - U @ (U.T @ y)
+    # A sample with leverage 1 is fit exactly only by itself; its LOO error is unbounded
+    with np.errstate(divide='ignore'):
+        loo_residual = residual / (1.0 - leverage)
+    return float(np.dot(loo_residual, loo_residual)) / y.shape[0]
 
 
 class LinearRegressionParamGrid(BaseModel):
     """Parameter grid for LinearRegressionModel."""
     model__fit_intercept: list[bool] = [True, False]
-    model__copy_X: list[bool] = [True, False]
+
+
+# Built once at import; tune() works on a copy so the default is never mutated
+_DEFAULT_GRID = LinearRegressionParamGrid().model_dump()
 
 
 class LinearRegressionModel(RegressionModel[Pipeline, LinearRegressionParamGrid]):
@@ -40,70 +77,87 @@ class LinearRegressionModel(RegressionModel[Pipeline, LinearRegressionParamGrid]
         Returns:
             Dictionary with 'best_params', 'best_score', and 'model'
         """
-        base_model = Pipeline([
-            ("scaler", StandardScaler()),
-            ("model", LinearRegression())
-        ])
-        
+        from sklearn.model_selection import ParameterGrid
+        from sklearn.preprocessing import StandardScaler
+
         # Use provided param_grid or default
         if param_grid is None:
-            param_grid_dict = LinearRegressionParamGrid().model_dump()
+            param_grid_dict = dict(_DEFAULT_GRID)
         else:
             # Convert pydantic model to dict, excluding None values
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
         
-        grid_search = GridSearchCV(
-            estimator=base_model,
-            param_grid=param_grid_dict,
-            cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
-        )
+        # Least squares has a closed-form leave-one-out error, so each candidate is
+        # scored from a single factorisation instead of five CV fits. Candidates
+        # without an intercept are scored on features standardised over the full
+        # training set, so the scaler's centring is taken from all rows.
+        X_values = as_contiguous_array(X_train, np.float64)
+        y_values = y_train.to_numpy(dtype=np.float64)
+        candidates = list(ParameterGrid(param_grid_dict))
+        scores = []
+        for round_num, params in enumerate(candidates, start=1):
+            if params.get('model__fit_intercept', True):
+                design = np.column_stack([np.ones(X_values.shape[0]), X_values])
+            else:
+                design = StandardScaler().fit_transform(X_values)
+            scores.append(-_loo_mse(design, y_values))
+            if progress_callback is not None:
+                progress_callback({
+                    'percentage': 100.0 * round_num / len(candidates),
+                    'round': round_num,
+                    'total_rounds': len(candidates),
+                    'metrics': {'mse': -scores[-1]},
+                    'params': params
+                })
         
-        grid_search.fit(X_train, y_train)
+        best = int(np.argmax(scores))
+        best_params = candidates[best]
+        best_model = _make_pipeline(best_params.get('model__fit_intercept', True)).set_params(**best_params).fit(X_train, y_train)
         
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': best_params,
+            'best_score': float(scores[best]),
+            'model': best_model
         }
     
     @staticmethod
-    def evaluate(model: Pipeline, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: Pipeline, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
         """
         Evaluate model performance on given data.
         
         Args:
             model: Trained model (sklearn Pipeline or estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             y: Target as Series
             
         Returns:
             Dictionary with MSE, MAE, and R2 scores
         """
+        from ._metrics_numba import mse_mae_r2
+
         y_pred = model.predict(X)
-        
+        mse, mae, r2 = mse_mae_r2(y, y_pred)
         return {
-            'mse': float(mean_squared_error(y, y_pred)),
-            'mae': float(mean_absolute_error(y, y_pred)),
-            'r2': float(r2_score(y, y_pred))
+            'mse': mse,
+            'mae': mae,
+            'r2': r2
         }
     
     @staticmethod
-    def predict(model: Pipeline, X: pd.DataFrame) -> pd.Series:
+    def predict(model: Pipeline, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         """
         Make predictions using trained model.
         
         Args:
             model: Trained model (sklearn Pipeline or estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             
         Returns:
             Predictions as Series
         """
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions')
     
     @staticmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> Pipeline:
@@ -114,12 +168,10 @@ class LinearRegressionModel(RegressionModel[Pipeline, LinearRegressionParamGrid]
             params: Model parameters
             
         Returns:
-            Sklearn Pipeline with StandardScaler and LinearRegression model
+            Sklearn Pipeline with a StandardScaler (passthrough when fitting an
+            intercept) and LinearRegression model
         """
-        model = Pipeline([
-            ("scaler", StandardScaler()),
-            ("model", LinearRegression())
-        ])
+        model = _make_pipeline(fit_intercept=(params or {}).get('model__fit_intercept', True))
         
         if params:
             model.set_params(**params)
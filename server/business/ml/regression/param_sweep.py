@@ -0,0 +1,356 @@
+"""
+Lightweight parameter sweep for preprocessing + estimator pipelines.
+
+GridSearchCV clones the whole pipeline for every (candidate, fold) pair, so the
+StandardScaler prefix is refit even when only the final estimator's
+hyperparameters change. ParamSweep fits the prefix once per fold and then only
+refits the terminal step for each candidate, setting its params in place.
+
+StagedSweep does the same for boosted ensembles along n_estimators: each
+candidate is fit once per fold with the largest ensemble size and every smaller
+size is scored from the staged predictions of that single fit.
+"""
+
+from typing import Dict, Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.model_selection import KFold, ParameterGrid, ParameterSampler
+from sklearn.pipeline import Pipeline
+
+from .base import ProgressInfo
+
+
+ArrayLike = Union[pd.DataFrame, pd.Series, np.ndarray]
+
+# Upper bound on progress callbacks per sweep
+MAX_PROGRESS_EVENTS = 100
+
+
+def _take(data: ArrayLike, indices: np.ndarray) -> ArrayLike:
+    """Select rows by position from a pandas object or ndarray."""
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[indices]
+    return data[indices]
+
+
+def neg_mse(y_true: ArrayLike, y_pred: np.ndarray) -> float:
+    """
+    Negative mean squared error without sklearn's per-call input validation.
+
+    Shared by the sweeps here and the models' own search loops, which call it
+    once per (candidate, fold, stage), where the validation in
+    mean_squared_error costs more than the arithmetic.
+    """
+    residual = np.asarray(y_true, dtype=np.float64) - y_pred
+    return -float(np.dot(residual, residual)) / residual.shape[0]
+
+
+def _sweep_fold(
+    estimator: Pipeline,
+    candidates: List[Dict[str, Any]],
+    X: ArrayLike,
+    y: ArrayLike,
+    train: np.ndarray,
+    test: np.ndarray,
+) -> List[float]:
+    """
+    Score every candidate on a single CV fold.
+
+    The pipeline prefix is refit only when a candidate changes one of its
+    params; candidates that differ only in final-step params reuse the
+    transformed fold data.
+
+    Returns:
+        Negative MSE on the held-out fold, one entry per candidate
+    """
+    pipeline = clone(estimator)
+    final_name, model = pipeline.steps[-1]
+    final_prefix = f"{final_name}__"
+    # A single-step pipeline has no prefix; its folds are used as given
+    head = Pipeline(pipeline.steps[:-1]) if len(pipeline.steps) > 1 else None
+
+    # Estimators such as Lasso can start from the previous candidate's solution
+    if 'warm_start' in model.get_params():
+        model.set_params(warm_start=True)
+
+    X_train, X_test = _take(X, train), _take(X, test)
+    y_train, y_test = _take(y, train), _take(y, test)
+
+    transformed: Dict[Tuple, Tuple[ArrayLike, ArrayLike]] = {}
+    scores = []
+    for params in candidates:
+        head_params = {k: v for k, v in params.items() if not k.startswith(final_prefix)}
+        key = tuple(sorted(head_params.items()))
+        if key not in transformed:
+            if head is None:
+                transformed[key] = (X_train, X_test)
+            else:
+                head.set_params(**head_params)
+                transformed[key] = (head.fit_transform(X_train, y_train), head.transform(X_test))
+        Xt_train, Xt_test = transformed[key]
+
+        model.set_params(**{
+            k[len(final_prefix):]: v for k, v in params.items() if k.startswith(final_prefix)
+        })
+        model.fit(Xt_train, y_train)
+        scores.append(neg_mse(y_test, model.predict(Xt_test)))
+
+    return scores
+
+
+class ParamSweep:
+    """
+    Cross-validated grid search over a Pipeline without per-candidate cloning.
+
+    Exposes the subset of the GridSearchCV interface used by the model modules:
+    `best_params_`, `best_score_` (mean negative MSE) and `best_estimator_`
+    (refit on the full training data).
+    """
+
+    def __init__(
+        self,
+        estimator: Pipeline,
+        param_grid: Dict[str, Any],
+        cv: int = 5,
+        n_jobs: int = -1,
+        n_iter: Optional[int] = None,
+        random_state: Optional[int] = None,
+        progress_callback: Optional[Callable[[ProgressInfo], None]] = None,
+    ):
+        """
+        Args:
+            estimator: Pipeline whose last step is the estimator being tuned
+            param_grid: Parameter grid in GridSearchCV format, or distributions
+                in RandomizedSearchCV format when n_iter is given
+            cv: Number of KFold splits
+            n_jobs: Number of folds evaluated in parallel
+            n_iter: If given, evaluate n_iter sampled candidates instead of the
+                full grid (the full grid is used when it is smaller)
+            random_state: Seed for candidate sampling
+            progress_callback: Called in this process after each fold finishes,
+                with the best candidate on that fold
+        """
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.n_iter = n_iter
+        self.random_state = random_state
+        self.progress_callback = progress_callback
+
+    def fit(self, X: ArrayLike, y: ArrayLike) -> "ParamSweep":
+        """
+        Run the sweep and refit the best candidate on all of X, y.
+
+        Args:
+            X: Training features
+            y: Training target
+
+        Returns:
+            self
+        """
+        if self.n_iter is None:
+            candidates = list(ParameterGrid(self.param_grid))
+        else:
+            candidates = list(ParameterSampler(self.param_grid, self.n_iter, random_state=self.random_state))
+        splits = KFold(n_splits=self.cv).split(X)
+        # Folds are sliced from one contiguous array instead of from the frame, so
+        # pandas indexing and sklearn's input conversion run once rather than per
+        # fold. The final refit still sees X itself and keeps its feature names.
+        X_values = np.ascontiguousarray(X.to_numpy()) if isinstance(X, pd.DataFrame) else X
+        y_values = y.to_numpy() if isinstance(y, pd.Series) else y
+
+        # Folds are consumed as they finish so progress can be reported while
+        # the remaining folds are still running in parallel
+        fold_scores = []
+        for scores in Parallel(n_jobs=self.n_jobs, return_as='generator_unordered')(
+            delayed(_sweep_fold)(self.estimator, candidates, X_values, y_values, train, test)
+            for train, test in splits
+        ):
+            fold_scores.append(scores)
+            if self.progress_callback is not None:
+                best = int(np.argmax(scores))
+                self.progress_callback({
+                    'percentage': 100.0 * len(fold_scores) / self.cv,
+                    'round': len(fold_scores),
+                    'total_rounds': self.cv,
+                    'metrics': {'mse': -scores[best]},
+                    'params': candidates[best]
+                })
+        scores = np.asarray(fold_scores)
+        mean_scores = scores.mean(axis=0)
+        best_index = int(np.argmax(mean_scores))
+
+        self.cv_results_ = {
+            'params': candidates,
+            'mean_test_score': mean_scores,
+            'std_test_score': scores.std(axis=0),
+        }
+        self.best_index_ = best_index
+        self.best_params_ = candidates[best_index]
+        self.best_score_ = float(mean_scores[best_index])
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        return self
+
+
+def staged_predict(model: Any, X: ArrayLike, n_estimators: Sequence[int]) -> Iterable[np.ndarray]:
+    """
+    Yield predictions after each of the given ensemble sizes.
+
+    Uses the estimator's own staged_predict; when boosting stopped early, the
+    last stage stands in for larger sizes, as a refit would stop there too.
+
+    Args:
+        model: Fitted ensemble exposing staged_predict
+        X: Features to predict
+        n_estimators: Ascending ensemble sizes
+
+    Yields:
+        Predictions for each size in n_estimators
+    """
+    wanted = iter(n_estimators)
+    target = next(wanted, None)
+    stage = None
+    for i, stage in enumerate(model.staged_predict(X), start=1):
+        while target is not None and i == target:
+            yield stage
+            target = next(wanted, None)
+        if target is None:
+            return
+    while target is not None:
+        yield stage
+        target = next(wanted, None)
+
+
+def _staged_fit(
+    estimator: Any,
+    params: Dict[str, Any],
+    n_estimators: Sequence[int],
+    predict_stages: Callable[[Any, ArrayLike, Sequence[int]], Iterable[np.ndarray]],
+    size_param: str,
+    X: ArrayLike,
+    y: ArrayLike,
+    train: np.ndarray,
+    test: np.ndarray,
+    task: Tuple[int, int],
+) -> Tuple[Tuple[int, int], List[float]]:
+    """
+    Score one candidate at every ensemble size on a single CV fold.
+
+    Returns:
+        The (candidate, fold) task index and the negative MSE on the held-out
+        fold, one entry per ensemble size
+    """
+    model = clone(estimator).set_params(**params, **{size_param: n_estimators[-1]})
+    model.fit(_take(X, train), _take(y, train))
+    y_test = _take(y, test)
+    return task, [neg_mse(y_test, y_pred) for y_pred in predict_stages(model, _take(X, test), n_estimators)]
+
+
+class StagedSweep:
+    """
+    Cross-validated grid search for ensembles that scores n_estimators for free.
+
+    n_estimators is taken out of the grid; each remaining candidate is fit with
+    the largest size and smaller sizes are scored from its staged predictions.
+    Exposes the same attributes as ParamSweep, with the ensemble size included
+    in `best_params_` under `size_param`.
+    """
+
+    def __init__(
+        self,
+        estimator: Any,
+        param_grid: Dict[str, Any],
+        n_estimators: Sequence[int],
+        predict_stages: Callable[[Any, ArrayLike, Sequence[int]], Iterable[np.ndarray]] = staged_predict,
+        size_param: str = 'n_estimators',
+        cv: int = 5,
+        n_jobs: int = -1,
+        n_iter: Optional[int] = None,
+        random_state: Optional[int] = None,
+        progress_callback: Optional[Callable[[ProgressInfo], None]] = None,
+    ):
+        """
+        Args:
+            estimator: Ensemble estimator with an ensemble size parameter
+            param_grid: Parameter grid without n_estimators
+            n_estimators: Ensemble sizes to score
+            predict_stages: Callable yielding predictions for each of the
+                ascending sizes given; defaults to the estimator's staged_predict
+            size_param: Name of the estimator's ensemble size parameter, e.g.
+                'max_iter' for HistGradientBoostingRegressor
+            cv: Number of KFold splits
+            n_jobs: Number of (candidate, fold) fits run in parallel
+            n_iter: If given, evaluate n_iter sampled candidates instead of the
+                full grid (the full grid is used when it is smaller)
+            random_state: Seed for candidate sampling
+            progress_callback: Called in this process as (candidate, fold) fits
+                finish, with that candidate's best ensemble size; throttled to
+                at most MAX_PROGRESS_EVENTS calls
+        """
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.n_estimators = n_estimators
+        self.predict_stages = predict_stages
+        self.size_param = size_param
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.n_iter = n_iter
+        self.random_state = random_state
+        self.progress_callback = progress_callback
+
+    def fit(self, X: ArrayLike, y: ArrayLike) -> "StagedSweep":
+        """
+        Run the sweep and refit the best candidate on all of X, y.
+
+        Args:
+            X: Training features
+            y: Training target
+
+        Returns:
+            self
+        """
+        if self.n_iter is None:
+            candidates = list(ParameterGrid(self.param_grid))
+        else:
+            candidates = list(ParameterSampler(self.param_grid, self.n_iter, random_state=self.random_state))
+        n_estimators = sorted(set(self.n_estimators))
+        splits = list(KFold(n_splits=self.cv).split(X))
+
+        # One task per (candidate, fold) pair: each task is a full ensemble fit.
+        # Results are consumed as they finish so progress can be reported live.
+        scores = np.empty((len(candidates), len(splits), len(n_estimators)))
+        total_rounds = scores.shape[0] * scores.shape[1]
+        # Large grids finish hundreds of fits; cap the UI at ~MAX_PROGRESS_EVENTS
+        report_every = max(1, total_rounds // MAX_PROGRESS_EVENTS)
+        for done, ((i, k), fit_scores) in enumerate(Parallel(n_jobs=self.n_jobs, return_as='generator_unordered')(
+            delayed(_staged_fit)(self.estimator, params, n_estimators, self.predict_stages, self.size_param, X, y, train, test, (i, k))
+            for i, params in enumerate(candidates)
+            for k, (train, test) in enumerate(splits)
+        ), start=1):
+            scores[i, k] = fit_scores
+            if self.progress_callback is not None and (done % report_every == 0 or done == total_rounds):
+                best = int(np.argmax(fit_scores))
+                self.progress_callback({
+                    'percentage': 100.0 * done / total_rounds,
+                    'round': done,
+                    'total_rounds': total_rounds,
+                    'metrics': {'mse': -fit_scores[best]},
+                    'params': {**candidates[i], self.size_param: n_estimators[best]}
+                })
+        mean_scores = scores.mean(axis=1)
+        best_i, best_j = np.unravel_index(int(np.argmax(mean_scores)), mean_scores.shape)
+
+        self.cv_results_ = {
+            'params': [{**params, self.size_param: n} for params in candidates for n in n_estimators],
+            'mean_test_score': mean_scores.ravel(),
+            'std_test_score': scores.std(axis=1).ravel(),
+        }
+        self.best_index_ = int(best_i * len(n_estimators) + best_j)
+        self.best_params_ = dict(sorted({**candidates[best_i], self.size_param: n_estimators[best_j]}.items()))
+        self.best_score_ = float(mean_scores[best_i, best_j])
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        return self
@@ -2,24 +2,80 @@
 Polynomial Regression Model Module
 """
 
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import GridSearchCV
+from joblib import parallel_config
+from scipy import sparse
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler, PolynomialFeatures
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, TransformerMixin
 
 from .base import RegressionModel, ProgressInfo, TuneResult
+from .param_sweep import ParamSweep
 
+# Estimators and preprocessing are imported inside the methods that use them,
+# so loading the module only pays for the sklearn core
+
+
+
+# Inputs with fewer non-zeros than this fraction are expanded as CSR matrices
+SPARSE_DENSITY_THRESHOLD = 0.1
+
+
+class _InputScaler(TransformerMixin, BaseEstimator):
+    """
+    StandardScaler that keeps mostly-zero inputs sparse.
+
+    Inputs with fewer non-zeros than SPARSE_DENSITY_THRESHOLD (e.g. one-hot
+    columns) give mostly-zero products, so they are converted to CSR and only
+    rescaled, since centring would fill in the zeros. The choice is made at fit
+    time, so refitting on the tuning data rebuilds the model that was scored.
+    """
+
+    def fit(self, X: Union[pd.DataFrame, np.ndarray], y: Optional[np.ndarray] = None) -> "_InputScaler":
+        from sklearn.preprocessing import StandardScaler
+
+        self.sparse_ = bool(np.count_nonzero(X) < SPARSE_DENSITY_THRESHOLD * np.size(X))
+        self.scaler_ = StandardScaler(with_mean=not self.sparse_).fit(self._to_input(X))
+        self.n_features_in_ = self.scaler_.n_features_in_
+        return self
+
+    def transform(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[np.ndarray, sparse.csr_matrix]:
+        return self.scaler_.transform(self._to_input(X))
+
+    def _to_input(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray, sparse.csr_matrix]:
+        return sparse.csr_matrix(np.asarray(X)) if self.sparse_ else X
+
+
+def _make_pipeline(degree: int = 2) -> Pipeline:
+    """
+    Build the scaler + PolynomialFeatures + Ridge pipeline shared by tune and create_model.
+
+    High-degree expansions have strongly correlated columns; a small ridge
+    penalty keeps the solve well conditioned where lstsq is slow. The 'auto'
+    solver is Cholesky on dense input and sparse_cg on CSR, which Cholesky
+    cannot fit an intercept on.
+    """
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import PolynomialFeatures
+
+    return Pipeline([
+        ("scaler", _InputScaler()),
+        ("poly", PolynomialFeatures(degree=degree, include_bias=False)),
+        ("model", Ridge(alpha=1e-4))
+    ])
 
 
 class PolynomialParamGrid(BaseModel):
     """Parameter grid for PolynomialRegressionModel."""
     poly__degree: list[int] = [2, 3, 4]
+    model__alpha: list[float] = [1e-6, 1e-4, 1e-2, 1.0]
+
+
+# Built once at import; tune() works on a copy so the default is never mutated
+_DEFAULT_GRID = PolynomialParamGrid().model_dump()
 
 
 class PolynomialRegressionModel(RegressionModel[Pipeline, PolynomialParamGrid]):
@@ -27,53 +83,97 @@ class PolynomialRegressionModel(RegressionModel[Pipeline, PolynomialParamGrid]):
     
     @staticmethod
     def tune(X_train: pd.DataFrame, y_train: pd.Series, param_grid: Optional[PolynomialParamGrid] = None, progress_callback: Optional[Callable[[ProgressInfo], None]] = None) -> TuneResult:
-        base_model = Pipeline([
-            ("poly", PolynomialFeatures(degree=2, include_bias=False)),
-            ("scaler", StandardScaler()),
-            ("model", LinearRegression())
-        ])
+        from sklearn.preprocessing import PolynomialFeatures
+
+        base_model = _make_pipeline()
     
         # Use provided param_grid or default
         if param_grid is None:
-            param_grid_dict = PolynomialParamGrid().model_dump()
+            param_grid_dict = dict(_DEFAULT_GRID)
         else:
             # Convert pydantic model to dict, excluding None values
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
     
-        grid_search = GridSearchCV(
-            estimator=base_model,
-            param_grid=param_grid_dict,
-            cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
-        )
+        # Inputs are standardised once up front, on the small input matrix
+        # rather than the expanded one. A degree-d polynomial of affinely
+        # transformed inputs is still a degree-d polynomial of the originals, so
+        # fitting the scaler on all training rows only moves the penalty's
+        # reference scale, not which functions each fold can fit.
+        # PolynomialFeatures is stateless, so expanding the full training set once
+        # and slicing folds out of it gives the same features as expanding each
+        # fold. Its output is ordered by total degree, so every lower degree's
+        # features are a column prefix of the highest degree's expansion. Only the
+        # ridge penalty is cross-validated per degree.
+        degree_grid = param_grid_dict.pop('poly__degree', [2])
+    
+        scaler = base_model.named_steps['scaler']
+        X_input = scaler.fit_transform(X_train)
+        tail = Pipeline(base_model.steps[2:])
     
-        grid_search.fit(X_train, y_train)
+        # float32 keeps the high-degree expansion from doubling memory
+        X_full = PolynomialFeatures(degree=max(degree_grid), include_bias=False).fit_transform(X_input).astype(np.float32, copy=False)
+    
+        # Folds report live from the parallel sweep of each degree in turn
+        total_rounds = len(degree_grid) * 5
+    
+        best = None
+        for d, degree in enumerate(degree_grid):
+            def report_fold(info: ProgressInfo, offset: int = d * 5, degree: int = degree) -> None:
+                progress_callback({
+                    'percentage': 100.0 * (offset + info['round']) / total_rounds,
+                    'round': offset + info['round'],
+                    'total_rounds': total_rounds,
+                    'metrics': info['metrics'],
+                    'params': {'poly__degree': degree, **info['params']}
+                })
+    
+            poly = PolynomialFeatures(degree=degree, include_bias=False).fit(X_input)
+            X_poly = X_full[:, :poly.n_output_features_]
+            sweep = ParamSweep(
+                estimator=tail,
+                param_grid=param_grid_dict,
+                cv=5,
+                n_jobs=-1,
+                progress_callback=report_fold if progress_callback is not None else None
+            )
+            # The Ridge solve runs in LAPACK/BLAS without the GIL, so threads share
+            # the expansion instead of copying it into worker processes
+            with parallel_config(backend='threading'):
+                sweep.fit(X_poly, y_train.to_numpy())
+            if best is None or sweep.best_score_ > best[2].best_score_:
+                best = (degree, poly, sweep)
+    
+        best_degree, best_poly, best_sweep = best
+        best_params = {'poly__degree': best_degree, **best_sweep.best_params_}
+        best_model = Pipeline([("scaler", scaler), ("poly", best_poly), *best_sweep.best_estimator_.steps])
     
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': best_params,
+            'best_score': float(best_sweep.best_score_),
+            'model': best_model
         }
 
 
     
     @staticmethod
-    def evaluate(model: Pipeline, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: Pipeline, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
+        from ._metrics_numba import mse_mae_r2
+
         y_pred = model.predict(X)
+        mse, mae, r2 = mse_mae_r2(y, y_pred)
         return {
-            'mse': float(mean_squared_error(y, y_pred)),
-            'mae': float(mean_absolute_error(y, y_pred)),
-            'r2': float(r2_score(y, y_pred))
+            'mse': mse,
+            'mae': mae,
+            'r2': r2
         }
 
 
     
     @staticmethod
-    def predict(model: Pipeline, X: pd.DataFrame) -> pd.Series:
+    def predict(model: Pipeline, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions', copy=False)
 
 
     
@@ -83,11 +183,7 @@ class PolynomialRegressionModel(RegressionModel[Pipeline, PolynomialParamGrid]):
         if params and 'poly__degree' in params:
             poly_degree = params.get('poly__degree', 2)
     
-        model = Pipeline([
-            ("poly", PolynomialFeatures(degree=poly_degree, include_bias=False)),
-            ("scaler", StandardScaler()),
-            ("model", LinearRegression())
-        ])
+        model = _make_pipeline(poly_degree)
     
         if params:
             model.set_params(**params)
@@ -3,18 +3,50 @@ Random Forest Model Module
 
 This module provides tune, evaluate, and predict functions for Random Forest regression.
 All functions accept pandas DataFrames instead of file paths.
+
+Tuning parallelizes candidate fits and builds each forest's trees serially;
+only the final refit builds trees in parallel, so the two never nest.
 """
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import GridSearchCV
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
-from sklearn.base import BaseEstimator
+from sklearn.model_selection import ParameterGrid, ParameterSampler
+from sklearn.base import BaseEstimator, clone
+
+from .base import RegressionModel, ProgressInfo, TuneResult, as_contiguous_array
+from .param_sweep import neg_mse
+
+
+# Grids with more (non-n_estimators) candidates than this are randomly sampled
+MAX_GRID_CANDIDATES = 20
+
 
-from .base import RegressionModel, ProgressInfo, TuneResult
+def _oob_scores(forest: RandomForestRegressor, X_train: np.ndarray, y_train: np.ndarray, n_estimators_grid: list[int]) -> np.ndarray:
+    """
+    Fit forest once and return the negative out-of-bag MSE of each n_estimators prefix.
 
+    Each tree predicts only the samples its bootstrap left out; a sample's OOB
+    prediction after k trees is the mean over the first k trees that did.
+    Samples no tree has left out yet are not scored, as in sklearn's oob_score.
+    """
+    forest.fit(X_train, y_train)
+    n_samples = y_train.shape[0]
+    prediction_sum = np.zeros(n_samples)
+    n_predictions = np.zeros(n_samples)
+    scores = []
+    for k, (tree, in_bag) in enumerate(zip(forest.estimators_, forest.estimators_samples_), start=1):
+        out_of_bag = np.ones(n_samples, dtype=bool)
+        out_of_bag[in_bag] = False
+        prediction_sum[out_of_bag] += tree.predict(X_train[out_of_bag])
+        n_predictions[out_of_bag] += 1
+        if k in n_estimators_grid:
+            scored = n_predictions > 0
+            scores.append(neg_mse(y_train[scored], prediction_sum[scored] / n_predictions[scored]))
+    return np.array(scores)
 
 
 class RandomForestParamGrid(BaseModel):
@@ -47,59 +79,92 @@ class RandomForestRegressionModel(RegressionModel[RandomForestRegressor, RandomF
         else:
             # Convert pydantic model to dict, excluding None values
             param_grid_dict = param_grid.model_dump(exclude_none=True)
-
         
-        grid_search = GridSearchCV(
-            estimator=base_model,
-            param_grid=param_grid_dict,
-            cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
+        # Candidates are scored by out-of-bag MSE: each bootstrapped tree is
+        # validated on the rows it never saw, so one fit on the training set
+        # replaces five CV fits. Trees are seeded sequentially from random_state,
+        # so the first k trees of the largest forest are exactly the k-tree
+        # forest. Fit once at the largest n_estimators and score every smaller
+        # size from prefix averages.
+        n_estimators_grid = sorted(set(param_grid_dict.pop('n_estimators', [base_model.n_estimators])))
+        max_estimators = n_estimators_grid[-1]
+        # len() of a ParameterGrid is computed from the value counts, so a large
+        # grid is never enumerated just to find out it will be sampled
+        grid = ParameterGrid(param_grid_dict)
+        if len(grid) > MAX_GRID_CANDIDATES:
+            candidates = list(ParameterSampler(param_grid_dict, MAX_GRID_CANDIDATES, random_state=42))
+        else:
+            candidates = list(grid)
+        # joblib hands out jobs as workers free up; starting the deepest (slowest)
+        # forests first keeps one of them from running alone at the end
+        candidates.sort(key=lambda params: -(params.get('max_depth') or np.inf))
+        # Candidates are fit on a contiguous array converted once up front; the
+        # final refit uses the DataFrame so the model keeps its feature names.
+        # The float32 default dtype matches sklearn's tree DTYPE, so the trees
+        # split on this array without copying it per fit.
+        X_values = as_contiguous_array(X_train, RandomForestRegressionModel.dtype)
+        y_values = y_train.to_numpy()
+        
+        # Every candidate runs as its own job with a single-threaded forest, so
+        # the per-tree OOB predictions are parallel too and the workers don't
+        # oversubscribe the CPUs
+        oob_scores = Parallel(n_jobs=-1)(
+            delayed(_oob_scores)(
+                clone(base_model).set_params(**params, n_estimators=max_estimators, n_jobs=1),
+                X_values, y_values, n_estimators_grid
+            )
+            for params in candidates
         )
+        # OOB score for each (candidate, n_estimators) pair
+        scores = np.array(oob_scores)
         
-        grid_search.fit(X_train, y_train)
+        best_i, best_j = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        best_params = dict(sorted({**candidates[best_i], 'n_estimators': n_estimators_grid[best_j]}.items()))
+        best_model = clone(base_model).set_params(**best_params).fit(X_train, y_train)
         
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': best_params,
+            'best_score': float(scores[best_i, best_j]),
+            'model': best_model
         }
     
     @staticmethod
-    def evaluate(model: RandomForestRegressor, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: RandomForestRegressor, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
         """
         Evaluate model performance on given data.
         
         Args:
             model: Trained model (sklearn estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             y: Target as Series
             
         Returns:
             Dictionary with MSE, MAE, and R2 scores
         """
+        from ._metrics_numba import mse_mae_r2
+
         y_pred = model.predict(X)
-        
+        mse, mae, r2 = mse_mae_r2(y, y_pred)
         return {
-            'mse': float(mean_squared_error(y, y_pred)),
-            'mae': float(mean_absolute_error(y, y_pred)),
-            'r2': float(r2_score(y, y_pred))
+            'mse': mse,
+            'mae': mae,
+            'r2': r2
         }
     
     @staticmethod
-    def predict(model: RandomForestRegressor, X: pd.DataFrame) -> pd.Series:
+    def predict(model: RandomForestRegressor, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         """
         Make predictions using trained model.
         
         Args:
             model: Trained model (sklearn estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             
         Returns:
             Predictions as Series
         """
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions', copy=False)
     
     @staticmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> RandomForestRegressor:
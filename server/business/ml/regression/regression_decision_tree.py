@@ -2,18 +2,25 @@
 Regression Decision Tree Model Module
 """
 
+from math import prod
+import numpy as np
 import pandas as pd
 from sklearn.tree import DecisionTreeRegressor
-from sklearn.model_selection import GridSearchCV
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV, HalvingRandomSearchCV, cross_val_score
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
 
-from .base import RegressionModel, ProgressInfo, TuneResult
+from .base import RegressionModel, ProgressInfo, TuneResult, as_contiguous_array
 
 
+# Grids larger than this start successive halving from a random sample of
+# candidates. Halving already discards most candidates on small subsamples, so
+# the default 36-point grid is still searched exhaustively.
+MAX_GRID_CANDIDATES = 100
+
 
 class DecisionTreeParamGrid(BaseModel):
     """Parameter grid for DecisionTreeRegressionModel."""
@@ -37,39 +44,81 @@ class DecisionTreeRegressionModel(RegressionModel[DecisionTreeRegressor, Decisio
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
     
-        grid_search = GridSearchCV(
+        # Candidates are fit on one contiguous array converted up front; the
+        # final refit uses the DataFrame so the model keeps its feature names.
+        # The float32 default dtype matches sklearn's tree DTYPE, so no fit
+        # copies it again.
+        X_values = as_contiguous_array(X_train, DecisionTreeRegressionModel.dtype)
+        y_values = y_train.to_numpy()
+    
+        # A single candidate has nothing to search; cross-validate it directly
+        if all(len(v) == 1 for v in param_grid_dict.values()):
+            best_params = {k: v[0] for k, v in sorted(param_grid_dict.items())}
+            scores = cross_val_score(
+                clone(base_model).set_params(**best_params),
+                X_values,
+                y_values,
+                cv=5,
+                scoring='neg_mean_squared_error',
+                n_jobs=-1
+            )
+            return {
+                'best_params': best_params,
+                'best_score': float(scores.mean()),
+                'model': clone(base_model).set_params(**best_params).fit(X_train, y_train)
+            }
+    
+        search_options = dict(
             estimator=base_model,
-            param_grid=param_grid_dict,
             cv=5,
             scoring='neg_mean_squared_error',
-            n_jobs=-1
+            n_jobs=-1,
+            refit=False
         )
+        # Successive halving: candidates are first scored on a subsample and only
+        # the best third is promoted to the next, larger sample size. Its first
+        # rung needs 2 * cv rows and a second rung factor times that, so smaller
+        # training sets are searched exhaustively instead.
+        halving_options = dict(factor=3, resource='n_samples', random_state=42, **search_options)
+        if len(X_values) < 2 * search_options['cv'] * halving_options['factor']:
+            grid_search = GridSearchCV(param_grid=param_grid_dict, **search_options)
+        elif prod(len(v) for v in param_grid_dict.values()) > MAX_GRID_CANDIDATES:
+            grid_search = HalvingRandomSearchCV(
+                param_distributions=param_grid_dict,
+                n_candidates=MAX_GRID_CANDIDATES,
+                **halving_options
+            )
+        else:
+            grid_search = HalvingGridSearchCV(param_grid=param_grid_dict, **halving_options)
     
-        grid_search.fit(X_train, y_train)
+        grid_search.fit(X_values, y_values)
     
         return {
             'best_params': grid_search.best_params_,
             'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'model': clone(base_model).set_params(**grid_search.best_params_).fit(X_train, y_train)
         }
 
 
     
     @staticmethod
-    def evaluate(model: DecisionTreeRegressor, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: DecisionTreeRegressor, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
+        from ._metrics_numba import mse_mae_r2
+
         y_pred = model.predict(X)
+        mse, mae, r2 = mse_mae_r2(y, y_pred)
         return {
-            'mse': float(mean_squared_error(y, y_pred)),
-            'mae': float(mean_absolute_error(y, y_pred)),
-            'r2': float(r2_score(y, y_pred))
+            'mse': mse,
+            'mae': mae,
+            'r2': r2
         }
 
 
     
     @staticmethod
-    def predict(model: DecisionTreeRegressor, X: pd.DataFrame) -> pd.Series:
+    def predict(model: DecisionTreeRegressor, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions', copy=False)
 
 
     
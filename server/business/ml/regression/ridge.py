@@ -7,17 +7,50 @@ All functions accept pandas DataFrames instead of file paths.
 
 from typing import Dict, Any, Union, Optional, Callable
 from pydantic import BaseModel
+import numpy as np
 import pandas as pd
 from sklearn.linear_model import Ridge
-from sklearn.model_selection import GridSearchCV
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
 
-from .base import RegressionModel, ProgressInfo, TuneResult
+from .base import RegressionModel, ProgressInfo, TuneResult, as_contiguous_array
 
 
+def _loo_mse(X: np.ndarray, y: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """
+    Exact leave-one-out MSE of a ridge fit with intercept, for each alpha.
+
+    X must have centred columns. With the eigendecomposition X^T X = V diag(s) V^T,
+    the fitted values are XV diag(1 / (s + alpha)) (XV)^T y and each sample's
+    leverage is 1/n + sum_k (XV)_ik^2 / (s_k + alpha); a held-out residual is the
+    full-fit residual divided by 1 - leverage, so no model is refit per sample.
+    This is RidgeCV's generalized cross-validation; a wide X is factorised with
+    its thin SVD instead of the p x p Gram matrix.
+    """
+    n_samples = y.shape[0]
+    y_mean = y.mean()
+    if X.shape[0] >= X.shape[1]:
+        s, V = np.linalg.eigh(X.T @ X)
+        s = np.clip(s, 0.0, None)
+        XV = X @ V
+    else:
+        U, S, _ = np.linalg.svd(X, full_matrices=False)
+        s, XV = S ** 2, U * S
+    XV_y = XV.T @ (y - y_mean)
+    XV_sq = XV ** 2
+    mse = np.empty(len(alphas))
+    for j, alpha in enumerate(alphas):
+        weights = 1.0 / (s + alpha)
+        residual = y - y_mean - XV @ (weights * XV_y)
+        leverage = 1.0 / n_samples + XV_sq @ weights
+        # A sample with leverage 1 is fit exactly only by itself; its LOO error is unbounded
+        with np.errstate(divide='ignore'):
+            loo_residual = residual / (1.0 - leverage)
+        mse[j] = float(np.dot(loo_residual, loo_residual)) / n_samples
+    return mse
+
 
 class RidgeParamGrid(BaseModel):
     """Parameter grid for RidgeRegression."""
@@ -32,6 +65,9 @@ class RidgeRegression(RegressionModel[Pipeline, RidgeParamGrid]):
         """
         Perform hyperparameter tuning for Ridge regression.
         
+        Alphas are scored by leave-one-out CV, which for ridge has a closed form
+        (generalized cross-validation, i.e. K-fold with K = n).
+        
         Args:
             X_train: Training features as DataFrame
             y_train: Training target as Series
@@ -39,10 +75,12 @@ class RidgeRegression(RegressionModel[Pipeline, RidgeParamGrid]):
         Returns:
             Dictionary with 'best_params', 'best_score', and 'model'
         """
-        # Define base pipeline model: Standardization + Ridge
+        # Define base pipeline model: Standardization + Ridge. LSQR iterates on X
+        # without forming X^T X and is at least as fast as the default Cholesky
+        # solve; it does not consume random_state
         base_model = Pipeline([
             ("scaler", StandardScaler()),
-            ("model", Ridge(random_state=42))
+            ("model", Ridge(solver='lsqr'))
         ])
         
         # Use provided param_grid or default
@@ -52,32 +90,41 @@ class RidgeRegression(RegressionModel[Pipeline, RidgeParamGrid]):
             # Convert pydantic model to dict, excluding None values
             param_grid_dict = param_grid.model_dump(exclude_none=True)
         
-        # Grid Search with 5-fold cross validation
-        grid_search = GridSearchCV(
-            estimator=base_model,
-            param_grid=param_grid_dict,
-            cv=5,
-            scoring='neg_mean_squared_error',
-            n_jobs=-1
-        )
+        # Ridge has a closed-form leave-one-out error, so the whole alpha grid is
+        # scored from one factorisation of the scaled training set instead of
+        # one per fold. The scaler is fit on all training rows, as in Linear
+        # Regression's LOO scoring.
+        alphas = np.array(param_grid_dict.get('model__alpha', [1.0]))
+        X_scaled = StandardScaler().fit_transform(as_contiguous_array(X_train, np.float64))
+        scores = -_loo_mse(X_scaled, y_train.to_numpy(dtype=np.float64), alphas)
+        best = int(np.argmax(scores))
+        best_params = {'model__alpha': float(alphas[best])}
+        best_score = float(scores[best])
         
-        # Run grid search
-        grid_search.fit(X_train, y_train)
+        # The alphas share one factorisation, so the whole sweep is one round
+        if progress_callback is not None:
+            progress_callback({
+                'percentage': 100.0,
+                'round': 1,
+                'total_rounds': 1,
+                'metrics': {'mse': -best_score},
+                'params': best_params
+            })
         
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': best_params,
+            'best_score': best_score,
+            'model': clone(base_model).set_params(**best_params).fit(X_train, y_train)
         }
     
     @staticmethod
-    def evaluate(model: Pipeline, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: Pipeline, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
         """
         Evaluate model performance on given data.
         
         Args:
             model: Trained model (sklearn Pipeline or estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             y: Target as Series
             
         Returns:
@@ -92,19 +139,19 @@ class RidgeRegression(RegressionModel[Pipeline, RidgeParamGrid]):
         }
     
     @staticmethod
-    def predict(model: Pipeline, X: pd.DataFrame) -> pd.Series:
+    def predict(model: Pipeline, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         """
         Make predictions using trained model.
         
         Args:
             model: Trained model (sklearn Pipeline or estimator)
-            X: Features as DataFrame
+            X: Features as DataFrame or ndarray
             
         Returns:
             Predictions as Series
         """
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions')
     
     @staticmethod
     def create_model(params: Optional[Dict[str, Any]] = None) -> Pipeline:
@@ -119,7 +166,7 @@ class RidgeRegression(RegressionModel[Pipeline, RidgeParamGrid]):
         """
         model = Pipeline([
             ("scaler", StandardScaler()),
-            ("model", Ridge(random_state=42))
+            ("model", Ridge(solver='lsqr'))
         ])
         
         if params:
@@ -2,23 +2,47 @@
 XGBoost Model Module
 """
 
+import os
 import pandas as pd
-from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 
 try:
+    import xgboost
     from xgboost import XGBRegressor
 except ImportError:
     raise ImportError("XGBoost is not installed. Please install it with: pip install xgboost")
 
-from typing import Dict, Any, Union, Optional, Callable
+from functools import lru_cache
+from typing import Dict, Any, Union, Optional, Callable, Iterable, Sequence
+import numpy as np
 from pydantic import BaseModel
 from sklearn.base import BaseEstimator
 
 from .base import RegressionModel, ProgressInfo, TuneResult
+from .param_sweep import StagedSweep
 
 
 
+@lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """Check once per process whether XGBoost can train on a CUDA device."""
+    if not xgboost.build_info().get('USE_CUDA', False):
+        return False
+    if os.environ.get('CUDA_VISIBLE_DEVICES', '').strip() == '-1':
+        return False
+    try:
+        XGBRegressor(device="cuda", n_estimators=1).fit(np.zeros((2, 1)), np.zeros(2))
+    except xgboost.core.XGBoostError:
+        return False
+    return True
+
+
+def _staged_predict(model: XGBRegressor, X: pd.DataFrame, n_estimators: Sequence[int]) -> Iterable[np.ndarray]:
+    """Yield predictions using only the first n boosting rounds for each n."""
+    for n in n_estimators:
+        yield model.predict(X, iteration_range=(0, n))
+
+
 class XGBoostParamGrid(BaseModel):
     """Parameter grid for XGBoostRegressionModel."""
     n_estimators: list[int] = [50, 100, 150]
@@ -34,7 +58,11 @@ class XGBoostRegressionModel(RegressionModel[XGBRegressor, XGBoostParamGrid]):
         base_model = XGBRegressor(
             objective="reg:squarederror",
             random_state=42,
-            n_jobs=-1
+            n_jobs=-1,
+            # Histogram method with fewer bins keeps per-round histograms cache resident
+            tree_method="hist",
+            device="cuda" if _cuda_available() else "cpu",
+            max_bin=64
         )
     
         # Use provided param_grid or default
@@ -45,26 +73,30 @@ class XGBoostRegressionModel(RegressionModel[XGBRegressor, XGBoostParamGrid]):
             param_grid_dict = param_grid.model_dump(exclude_none=True)
 
     
-        grid_search = GridSearchCV(
+        # n_estimators is scored from staged predictions: each candidate is fit once
+        # per fold with the largest ensemble and smaller sizes reuse its first trees
+        n_estimators_grid = param_grid_dict.pop('n_estimators', [base_model.n_estimators])
+        sweep = StagedSweep(
             estimator=base_model,
             param_grid=param_grid_dict,
+            n_estimators=n_estimators_grid,
+            predict_stages=_staged_predict,
             cv=5,
-            scoring='neg_mean_squared_error',
             n_jobs=-1
         )
     
-        grid_search.fit(X_train, y_train)
+        sweep.fit(X_train, y_train)
     
         return {
-            'best_params': grid_search.best_params_,
-            'best_score': float(grid_search.best_score_),
-            'model': grid_search.best_estimator_
+            'best_params': sweep.best_params_,
+            'best_score': float(sweep.best_score_),
+            'model': sweep.best_estimator_
         }
 
 
     
     @staticmethod
-    def evaluate(model: XGBRegressor, X: pd.DataFrame, y: pd.Series) -> Dict[str, float]:
+    def evaluate(model: XGBRegressor, X: Union[pd.DataFrame, np.ndarray], y: pd.Series) -> Dict[str, float]:
         y_pred = model.predict(X)
         return {
             'mse': float(mean_squared_error(y, y_pred)),
@@ -75,9 +107,9 @@ class XGBoostRegressionModel(RegressionModel[XGBRegressor, XGBoostParamGrid]):
 
     
     @staticmethod
-    def predict(model: XGBRegressor, X: pd.DataFrame) -> pd.Series:
+    def predict(model: XGBRegressor, X: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
         predictions = model.predict(X)
-        return pd.Series(predictions, index=X.index, name='predictions')
+        return pd.Series(predictions, index=X.index if isinstance(X, pd.DataFrame) else None, name='predictions')
 
 
     
@@ -86,7 +118,11 @@ class XGBoostRegressionModel(RegressionModel[XGBRegressor, XGBoostParamGrid]):
         model = XGBRegressor(
             objective="reg:squarederror",
             random_state=42,
-            n_jobs=-1
+            n_jobs=-1,
+            # Histogram method with fewer bins keeps per-round histograms cache resident
+            tree_method="hist",
+            device="cuda" if _cuda_available() else "cpu",
+            max_bin=64
         )
         if params:
             model.set_params(**params)
@@ -14,27 +14,7 @@ from typing import Dict, List, Any
 # Add current directory to path
 sys.path.append(str(Path(__file__).parent))
 
-from base import import_model
-
-
-def get_param_grid_class(model_class):
-    """
-    Extract the ParamGrid class from a model class's type hints.
-    
-    Args:
-        model_class: The model class to inspect
-        
-    Returns:
-        The ParamGrid class if found, None otherwise
-    """
-    # Get the class's __orig_bases__ to access Generic parameters
-    if hasattr(model_class, '__orig_bases__'):
-        for base in model_class.__orig_bases__:
-            # Check if this is a Generic type with parameters
-            if hasattr(base, '__args__') and len(base.__args__) >= 2:
-                # Second type parameter is ParamGridType
-                return base.__args__[1]
-    return None
+from base import import_model, get_param_grid_class
 
 
 def scan_models_in_directory(category: str, directory: Path) -> List[Dict[str, Any]]:
@@ -52,8 +32,8 @@ def scan_models_in_directory(category: str, directory: Path) -> List[Dict[str, A
     
     # Iterate through all Python files in the directory
     for file_path in directory.glob('*.py'):
-        # Skip __init__.py and base.py
-        if file_path.name in ['__init__.py', 'base.py']:
+        # Skip __init__.py, base.py and shared helper modules
+        if file_path.name in ['__init__.py', 'base.py', 'param_sweep.py', '_metrics_numba.py']:
             continue
             
         # Extract module name without .py extension
@@ -8,6 +8,12 @@ import sys
 import time
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # Falls back to the standard library encoder
+    orjson = None
+
 
 # OpenTelemetry severity mapping
 SEVERITY_MAPPING = {
@@ -18,6 +24,33 @@ SEVERITY_MAPPING = {
     logging.CRITICAL: (21, 'CRITICAL'),
 }
 
+# Resource attributes shared by every log record
+SERVICE_RESOURCE = {
+    'service.name': 'xenix-ml-pipeline',
+    'service.version': '1.0.0'
+}
+
+
+def _write_json_line(data: dict):
+    """
+    Write one JSON document and its newline to stdout in a single write.
+    
+    A single write keeps lines from concurrent worker processes from
+    interleaving. orjson is used when installed; with it numpy scalars are
+    serialized natively and NaN becomes null instead of invalid JSON.
+    
+    Args:
+        data: JSON-serializable message
+    """
+    if orjson is not None:
+        line = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = (json.dumps(data) + '\n').encode()
+    # Anything still buffered in the text layer goes out first, keeping order
+    sys.stdout.flush()
+    sys.stdout.buffer.write(line)
+    sys.stdout.buffer.flush()
+
 
 def emit_log(message: str, level: int = logging.INFO, **kwargs):
     """
@@ -28,13 +61,14 @@ def emit_log(message: str, level: int = logging.INFO, **kwargs):
         level: Python logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         **kwargs: Additional attributes
     """
-    severity_number, severity_text = SEVERITY_MAPPING.get(level, (0, 'UNKNOWN'))
-    
-    # Only emit INFO and above
-    if severity_number < 9:
+    # Only emit INFO and above; unknown levels are dropped
+    if level not in SEVERITY_MAPPING or level < logging.INFO:
         return
     
-    timestamp_ns = int(time.time() * 1e9)
+    severity_number, severity_text = SEVERITY_MAPPING[level]
+    
+    # Integer nanoseconds, without float rounding of the epoch time
+    timestamp_ns = time.time_ns()
     
     log_data = {
         'type': 'log',
@@ -44,15 +78,12 @@ def emit_log(message: str, level: int = logging.INFO, **kwargs):
             'severity_text': severity_text,
             'severity_number': severity_number,
             'body': message,
-            'resource': {
-                'service.name': 'xenix-ml-pipeline',
-                'service.version': '1.0.0'
-            },
+            'resource': SERVICE_RESOURCE,
             'attributes': kwargs
         }
     }
     
-    print(json.dumps(log_data), flush=True)
+    _write_json_line(log_data)
 
 
 def emit_result(model: str, params: dict, metrics: dict):
@@ -73,7 +104,7 @@ def emit_result(model: str, params: dict, metrics: dict):
         }
     }
     
-    print(json.dumps(result_data), flush=True)
+    _write_json_line(result_data)
 
 
 def emit_comparison_result(results: list, best_model: str):
@@ -92,7 +123,7 @@ def emit_comparison_result(results: list, best_model: str):
         }
     }
     
-    print(json.dumps(comparison_data), flush=True)
+    _write_json_line(comparison_data)
 
 
 def emit_status(status: str, error: str = None):
@@ -111,7 +142,7 @@ def emit_status(status: str, error: str = None):
         }
     }
     
-    print(json.dumps(status_data), flush=True)
+    _write_json_line(status_data)
 
 
 class StructuredLogger:
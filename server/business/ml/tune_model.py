@@ -4,9 +4,14 @@ Generic hyperparameter tuning script using modular model definitions.
 Each model is imported as a module with a Model class providing tune(), evaluate(), and predict() methods.
 Outputs structured JSON to stdout for the Node.js executor to parse.
 """
+import contextlib
 import json
+import os
 import sys
+import tempfile
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import joblib
 import pandas as pd
 from pathlib import Path
 
@@ -20,30 +25,60 @@ sys.path.append(str(Path(__file__).parent))
 from structured_output import get_logger, emit_result
 
 # Import base utilities
-from base import import_model
+from base import import_model, get_param_grid_class, read_stdin_with_warm_imports
+
+# Import data loading utilities
+from data_io import load_table
 
 # Import basic sklearn libraries
 from sklearn.model_selection import train_test_split
 
 
-def tune_regression_model(model_name: str, input_file: str, feature_columns: list, target_column: str, logger, param_grid_dict: dict = None):
+# Names a joblib backend for the models' CV fits, e.g. "ray" to spread them
+# over a Ray cluster; unset keeps joblib's local default
+JOBLIB_BACKEND_ENV = 'XENIX_JOBLIB_BACKEND'
+
+
+def joblib_backend_context(logger):
     """
-    Tune a regression model using hyperparameter search.
+    Select the joblib backend named by XENIX_JOBLIB_BACKEND for tuning.
+    
+    Models that pin a backend for their own search (threads sharing a
+    polynomial expansion, loky with single-threaded BLAS) keep it.
+    
+    Args:
+        logger: Logger instance for logging progress
+        
+    Returns:
+        Context manager applying the backend, or a no-op when it is unset
+    """
+    backend = os.environ.get(JOBLIB_BACKEND_ENV)
+    if not backend:
+        return contextlib.nullcontext()
+    if backend == 'ray':
+        # Ray ships its joblib backend but only registers it on request
+        from ray.util.joblib import register_ray
+        register_ray()
+    logger.info(f"Using joblib backend '{backend}' for tuning")
+    return joblib.parallel_config(backend=backend, n_jobs=-1)
+
+
+def load_training_data(input_file: str, feature_columns: list, target_column: str, logger):
+    """
+    Load a dataset and split it into train and test sets.
     
     Args:
-        model_name: Name of the regression model (e.g., "regression.ridge")
         input_file: Path to training data file
         feature_columns: List of feature column names
         target_column: Target column name
         logger: Logger instance for logging progress
-        param_grid_dict: Optional custom parameter grid dictionary
         
     Returns:
-        Tuple of (best_params, metrics) where metrics contains train and test scores
+        Tuple of (X_train, X_test, y_train, y_test)
     """
     # Load data
     logger.info(f"Loading training data from {input_file}")
-    df = pd.read_excel(input_file)
+    df = load_table(input_file, columns=[*feature_columns, target_column])
     logger.info(f"Data loaded: {len(df)} rows, {len(df.columns)} columns")
     
     # Define features and target
@@ -58,10 +93,58 @@ def tune_regression_model(model_name: str, input_file: str, feature_columns: lis
     )
     logger.info(f"Train set: {len(X_train)} samples, Test set: {len(X_test)} samples")
     
+    return X_train, X_test, y_train, y_test
+
+
+def tune_regression_model(model_name: str, input_file: str, feature_columns: list, target_column: str, logger, param_grid_dict: dict = None, report_train_metrics: bool = False, model_output_path: str = None):
+    """
+    Tune a regression model using hyperparameter search.
+    
+    Args:
+        model_name: Name of the regression model (e.g., "regression.ridge")
+        input_file: Path to training data file
+        feature_columns: List of feature column names
+        target_column: Target column name
+        logger: Logger instance for logging progress
+        param_grid_dict: Optional custom parameter grid dictionary
+        report_train_metrics: Also evaluate the best model on the training set
+        model_output_path: Optional path to save the fitted best model to with joblib
+        
+    Returns:
+        Tuple of (best_params, metrics) where metrics contains test (and optionally train) scores
+    """
+    X_train, X_test, y_train, y_test = load_training_data(input_file, feature_columns, target_column, logger)
+    return tune_split_regression_model(model_name, X_train, X_test, y_train, y_test, logger, param_grid_dict, report_train_metrics, model_output_path)
+
+
+def tune_split_regression_model(model_name: str, X_train: pd.DataFrame, X_test: pd.DataFrame, y_train: pd.Series, y_test: pd.Series, logger, param_grid_dict: dict = None, report_train_metrics: bool = False, model_output_path: str = None):
+    """
+    Tune a regression model on an already loaded train/test split.
+    
+    Args:
+        model_name: Name of the regression model (e.g., "regression.ridge")
+        X_train: Training features
+        X_test: Test features
+        y_train: Training target
+        y_test: Test target
+        logger: Logger instance for logging progress
+        param_grid_dict: Optional custom parameter grid dictionary
+        report_train_metrics: Also evaluate the best model on the training set
+        model_output_path: Optional path to save the fitted best model to with joblib
+        
+    Returns:
+        Tuple of (best_params, metrics) where metrics contains test (and optionally train) scores
+    """
     # Import Model class directly
     logger.info(f"Importing regression model for {model_name}")
     Model = import_model(model_name)
     
+    # Downcast features and training target to the model's preferred dtype; the
+    # test target keeps full precision for the reported metrics
+    X_train = X_train.astype(Model.dtype, copy=False)
+    X_test = X_test.astype(Model.dtype, copy=False)
+    y_train = y_train.astype(Model.dtype, copy=False)
+    
     # Define progress callback with TypedDict structure
     def progress_callback(progress_info: dict) -> None:
         """Log progress during hyperparameter tuning"""
@@ -78,45 +161,54 @@ def tune_regression_model(model_name: str, input_file: str, feature_columns: lis
             logger.info(f"  Current params: {params}")
     
     # Perform hyperparameter tuning using the model's tune function
-    logger.info(f"Starting hyperparameter tuning with GridSearchCV")
+    logger.info(f"Starting hyperparameter tuning for {model_name}")
     
     # Convert param_grid_dict to pydantic model instance if provided
     param_grid_instance = None
     if param_grid_dict:
         logger.info(f"Using custom parameter grid: {param_grid_dict}")
         # Get the ParamGrid class from the Model
-        if hasattr(Model, '__orig_bases__'):
-            for base in Model.__orig_bases__:
-                if hasattr(base, '__args__') and len(base.__args__) >= 2:
-                    ParamGridClass = base.__args__[1]
-                    try:
-                        param_grid_instance = ParamGridClass(**param_grid_dict)
-                        logger.info(f"Created param grid instance: {param_grid_instance}")
-                    except Exception as e:
-                        logger.warning(f"Failed to create param grid instance: {e}. Using provided dict directly.")
-    
-    tune_result = Model.tune(X_train, y_train, param_grid=param_grid_instance, progress_callback=progress_callback)
+        ParamGridClass = get_param_grid_class(Model)
+        if ParamGridClass is not None:
+            try:
+                param_grid_instance = ParamGridClass(**param_grid_dict)
+                logger.info(f"Created param grid instance: {param_grid_instance}")
+            except Exception as e:
+                logger.warning(f"Failed to create param grid instance: {e}. Using provided dict directly.")
+    
+    with joblib_backend_context(logger):
+        tune_result = Model.tune(X_train, y_train, param_grid=param_grid_instance, progress_callback=progress_callback)
     
     best_params = tune_result['best_params']
     best_model = tune_result['model']
     logger.info(f"Best parameters found: {best_params}")
     logger.info(f"Best CV score: {tune_result['best_score']}")
     
-    # Evaluate on train and test sets using the model's evaluate function
-    logger.info("Evaluating best model on train and test sets")
-    train_metrics = Model.evaluate(best_model, X_train, y_train)
-    test_metrics = Model.evaluate(best_model, X_test, y_test)
+    # Persist the already-fitted best model so predict.py can skip refitting it
+    if model_output_path:
+        logger.info(f"Saving fitted model to {model_output_path}")
+        joblib.dump(best_model, model_output_path)
     
-    # Combine metrics
+    # Evaluate on the test set using the model's evaluate function
+    logger.info("Evaluating best model on test set")
+    test_metrics = Model.evaluate(best_model, X_test, y_test)
     metrics = {
-        'mse_train': train_metrics['mse'],
-        'mae_train': train_metrics['mae'],
-        'r2_train': train_metrics['r2'],
         'mse_test': test_metrics['mse'],
         'mae_test': test_metrics['mae'],
         'r2_test': test_metrics['r2']
     }
     
+    # Predicting the whole training set is skipped unless explicitly requested
+    if report_train_metrics:
+        logger.info("Evaluating best model on train set")
+        train_metrics = Model.evaluate(best_model, X_train, y_train)
+        metrics = {
+            'mse_train': train_metrics['mse'],
+            'mae_train': train_metrics['mae'],
+            'r2_train': train_metrics['r2'],
+            **metrics
+        }
+    
     logger.info("Model evaluation completed")
     for key, value in metrics.items():
         logger.info(f"  {key}: {value:.4f}")
@@ -124,6 +216,75 @@ def tune_regression_model(model_name: str, input_file: str, feature_columns: lis
     return best_params, metrics
 
 
+
+def tune_one(model_name: str, data_path: str, param_grid_dict: dict = None, report_train_metrics: bool = False):
+    """
+    Worker entry point for tuning one model of a multi-model run.
+    
+    Args:
+        model_name: Name of the regression model (e.g., "regression.ridge")
+        data_path: Path to the joblib dump of (X_train, X_test, y_train, y_test)
+        param_grid_dict: Optional custom parameter grid dictionary
+        report_train_metrics: Also evaluate the best model on the training set
+        
+    Returns:
+        Tuple of (best_params, metrics)
+    """
+    logger = get_logger(model_name)
+    # Memory-map the shared split instead of receiving a pickled copy per worker
+    X_train, X_test, y_train, y_test = joblib.load(data_path, mmap_mode='r')
+    return tune_split_regression_model(model_name, X_train, X_test, y_train, y_test, logger, param_grid_dict, report_train_metrics)
+
+
+def tune_regression_models(model_names: list, input_file: str, feature_columns: list, target_column: str, logger, param_grids: dict = None, report_train_metrics: bool = False) -> list:
+    """
+    Tune several regression models concurrently in one interpreter.
+    
+    The dataset is loaded and split once, dumped to a temporary file and
+    memory-mapped by each worker process. Results are emitted as each model
+    finishes.
+    
+    Args:
+        model_names: Names of the regression models to tune
+        input_file: Path to training data file
+        feature_columns: List of feature column names
+        target_column: Target column name
+        logger: Logger instance for logging progress
+        param_grids: Optional mapping of model name to custom parameter grid
+        report_train_metrics: Also evaluate the best models on the training set
+        
+    Returns:
+        List of model names that failed to tune
+    """
+    param_grids = param_grids or {}
+    split = load_training_data(input_file, feature_columns, target_column, logger)
+    
+    # Each model already parallelizes its own search, so only run a few at once
+    max_workers = min(len(model_names), max(1, (os.cpu_count() or 1) // 4))
+    logger.info(f"Tuning {len(model_names)} models with {max_workers} worker processes")
+    
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = os.path.join(tmp_dir, 'split.joblib')
+        joblib.dump(split, data_path)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(tune_one, name, data_path, param_grids.get(name), report_train_metrics): name
+                for name in model_names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    best_params, metrics = future.result()
+                except Exception as e:
+                    logger.error(f"Error tuning {name}: {str(e)}")
+                    failed.append(name)
+                    continue
+                emit_result(name, best_params, metrics)
+    
+    return failed
+
 def main():
     """
     Main function that reads JSON input from stdin.
@@ -132,15 +293,20 @@ def main():
         "inputFile": "/path/to/data.xlsx",
         "model": "ridge",
         "featureColumns": ["col1", "col2", "col3"],
-        "targetColumn": "target"
+        "targetColumn": "target",
+        "reportTrainMetrics": false,
+        "modelOutputPath": "/path/to/model.joblib"
     }
+    "modelOutputPath" is optional; when set, the fitted best model is saved there.
+    "model" may also be a comma-separated list (e.g. "regression.ridge,regression.lasso")
+    to tune several models in one process; "paramGrid" then maps model names to grids.
     """
     logger = get_logger(__name__)
     
     try:
         # Read input from stdin
         logger.info("Reading input configuration from stdin")
-        input_data = json.loads(sys.stdin.read())
+        input_data = json.loads(read_stdin_with_warm_imports())
         
         # Extract parameters
         input_file = input_data.get('inputFile')
@@ -148,6 +314,8 @@ def main():
         feature_columns = input_data.get('featureColumns')
         target_column = input_data.get('targetColumn')
         param_grid = input_data.get('paramGrid')  # Optional custom param grid
+        report_train_metrics = input_data.get('reportTrainMetrics', False)
+        model_output_path = input_data.get('modelOutputPath')
         
         # Validate required parameters
         if not input_file:
@@ -159,12 +327,30 @@ def main():
         if not target_column:
             raise ValueError("targetColumn is required")
         
+        model_names = [name.strip() for name in model_name.split(',') if name.strip()]
+        if len(model_names) > 1:
+            if model_output_path:
+                raise ValueError("modelOutputPath is only supported when tuning a single model")
+            for name in model_names:
+                if not name.startswith('regression.'):
+                    raise ValueError(f"Unknown model type for '{name}'. Model name should start with 'regression.', 'classification.', etc.")
+            
+            logger.info(f"Starting hyperparameter tuning for {', '.join(model_names)}")
+            failed = tune_regression_models(
+                model_names, input_file, feature_columns, target_column, logger, param_grid, report_train_metrics
+            )
+            if failed:
+                raise RuntimeError(f"Tuning failed for: {', '.join(failed)}")
+            
+            logger.info("Hyperparameter tuning completed successfully!")
+            return
+        
         logger.info(f"Starting hyperparameter tuning for {model_name}")
         
         # Determine model type and call appropriate tuning function
         if model_name.startswith('regression.'):
             best_params, metrics = tune_regression_model(
-                model_name, input_file, feature_columns, target_column, logger, param_grid
+                model_name, input_file, feature_columns, target_column, logger, param_grid, report_train_metrics, model_output_path
             )
         # Future: Add support for other model types
         # elif model_name.startswith('classification.'):